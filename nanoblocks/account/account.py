@@ -286,7 +286,7 @@ class Account(NanoblocksClass):
 
         Note: a call to `update()` or `offline_update()` before `confirmed_balance` is highly encouraged!!
         """
-        return Amount(self._account_info['balance'], unit="raw")
+        return Amount.of(self._account_info['balance'], unit="raw")
 
     @property
     def pending_balance(self):
@@ -295,7 +295,7 @@ class Account(NanoblocksClass):
 
         Note: a call to `update()` or `offline_update()` before `pending_balance` is highly encouraged!!
         """
-        return Amount(self._account_info['pending'], unit="raw")
+        return Amount.of(self._account_info['pending'], unit="raw")
 
     @property
     def pending_transactions(self):
@@ -399,11 +399,13 @@ class Account(NanoblocksClass):
         return representation_formatted
 
     def __str__(self):
+        currency_unit = rcParams['currency.unit']
+
         return f"{self.address} (\n\t" \
                f"Total blocks: {self.block_count}\n\t" \
-               f"Total balance: {self.balance.as_unit(rcParams['currency.unit']).format()}\n\t" \
-               f"Confirmed balance: {self.confirmed_balance.as_unit(rcParams['currency.unit']).format()}\n\t" \
-               f"Pending balance: {self.pending_balance.as_unit(rcParams['currency.unit']).format()}\n\t" \
+               f"Total balance: {self.balance.as_unit(currency_unit).format()}\n\t" \
+               f"Confirmed balance: {self.confirmed_balance.as_unit(currency_unit).format()}\n\t" \
+               f"Pending balance: {self.pending_balance.as_unit(currency_unit).format()}\n\t" \
                f"Last confirmed payment: {self.modified_date}\n\t" \
                f"Is virtual: {self.is_virtual}\n\t" \
                f"Last update: {self._last_update.isoformat()} ({self.last_update_elapsed_seconds} seconds ago)\n)"
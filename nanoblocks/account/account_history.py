@@ -1,4 +1,5 @@
 from nanoblocks.base import NanoblocksClass
+from nanoblocks.block.block import timestamps_bulk
 
 
 class AccountHistory(NanoblocksClass):
@@ -135,10 +136,7 @@ class AccountHistory(NanoblocksClass):
 
         start_end_range = end - start
 
-        result = []
-        account_owner = self._account_owner
-
-        block_factory = self.blocks.factory
+        block_definitions = []
 
         for i, block_definition in enumerate(self._customized_iter(start, reverse=reverse,
                                                                    account_filter=self._history_filter_accounts)):
@@ -148,13 +146,17 @@ class AccountHistory(NanoblocksClass):
             if 'subtype' not in block_definition:
                 continue  # We skip blocks without subtypes
 
-            block = block_factory.build(account_owner, block_definition, type_key='subtype')
-            result.append(block)
+            block_definitions.append(block_definition)
 
             # We iterate until we met the desired range
             if i+1 >= start_end_range:
                 break
 
+        result = self.blocks.factory.build_many(self._account_owner, block_definitions, type_key='subtype')
+
+        # Local dates of the whole page are converted at once rather than block by block.
+        timestamps_bulk(result, self.node_backend.timezone)
+
         if len(result) == 1 and was_int:
             result = result[0]
 
@@ -92,7 +92,7 @@ class AccountPendingHistory(NanoblocksClass):
                 'height': 'unknown',
                 'type': 'send',
                 'link_as_account': self._account_owner.address,
-                'amount': Amount(block_def['amount'], unit="raw"),
+                'amount': Amount.of(block_def['amount'], unit="raw"),
                 'hash': block_hash,
                 'local_timestamp': 'Unknown'
             }) for block_hash, block_def in pending_hashes.items()
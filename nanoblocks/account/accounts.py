@@ -93,25 +93,33 @@ class Accounts(NanoblocksClass):
 
             # Bulk retrieval of accounts. We take minimum information for each account. If a cache is enabled, we try to
             # fetch them first from the cache. In case of a cache miss, we instance the account.
+            # Repeated addresses are requested only once.
+            nano_account_address = list(dict.fromkeys(nano_account_address))
+            cached_addresses = {address for address in nano_account_address if address in self._cached_accounts}
+
             accounts = {address: (self._cached_accounts.get(address) or Account(address, nano_network=self.network, initial_update=False))
                         for address in nano_account_address}
 
-            balances = self.node_backend.accounts_balances(nano_account_address)['balances']
-            frontiers = self.node_backend.accounts_frontiers(nano_account_address)['frontiers']
+            # A single round trip to the node for the balances and frontiers of every account.
+            balances, frontiers = self.node_backend.accounts_balances_frontiers(nano_account_address)
+            balances = balances['balances']
+            frontiers = frontiers.get('frontiers') or {}
 
             for nano_address in nano_account_address:
                 nano_account = accounts[nano_address]
                 nano_balances = balances[nano_address]
-                nano_frontier = frontiers[nano_address]
 
                 dict_update = {
                     'balance': nano_balances['balance'],
                     'pending': nano_balances['pending'],
-                    'frontier': nano_frontier,
                 }
 
+                # Unopened accounts have no frontier
+                if nano_address in frontiers:
+                    dict_update['frontier'] = frontiers[nano_address]
+
                 # We don't override block_count or modified_timestamp in cached accounts.
-                if nano_address in self._cache_accounts:
+                if nano_address not in cached_addresses:
                     dict_update.update({
                         'block_count': 'unknown',
                         'modified_timestamp': 0  # TODO: maybe we should update modified timestamp and set now() here?
@@ -155,6 +163,29 @@ class Accounts(NanoblocksClass):
 
         return account
 
+    def lazy_fetch_many(self, nano_account_addresses):
+        """
+        Fetchs many accounts lazily, without querying the node.
+
+        Same as `lazy_fetch()` for a list of addresses, but the cache is updated only once for all of them.
+
+        :param nano_account_addresses:
+            Iterable of nano account addresses with format "nano_...". Repeated addresses are allowed.
+
+        :return:
+            Dictionary of {nano_address: Account}.
+        """
+        cached_accounts = self._cached_accounts
+
+        accounts = {address: cached_accounts.get(address) or Account(address, self.network, initial_update=False)
+                    for address in dict.fromkeys(nano_account_addresses)}
+
+        # If there is a cache enabled, we cache the accounts objects so that further calls reuse the same object.
+        if self._cache_enabled:
+            self._cache_accounts(accounts)
+
+        return accounts
+
     def __len__(self):
         """
         Returns the number of accounts registered in the network, in case the backend is available.
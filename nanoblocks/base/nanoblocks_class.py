@@ -4,6 +4,8 @@ class NanoblocksClass:
     """
     Global class that should be inherited by any Nanoblocks class that requires access to the network.
     """
+    __slots__ = ('_nano_network',)
+
     def __init__(self, nano_network):
         self._nano_network = nano_network
 
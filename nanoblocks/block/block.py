@@ -1,9 +1,52 @@
 import datetime
 from time import sleep
 
+import numpy as np
 import pandas as pd
 
 from nanoblocks.base import NanoblocksClass
+from nanoblocks.ipython.img import get_svg
+
+# Mask to fold the 256-bit block hash into a positive integer suitable for __hash__
+_HASH_MASK = (1 << 63) - 1
+
+
+def _timestamp_seconds(block_time):
+    """
+    Parses the local timestamp of a block definition into seconds. Unknown timestamps are set to 0.
+    """
+    try:
+        return int(block_time)
+    except (TypeError, ValueError):
+        return 0
+
+
+def timestamps_bulk(blocks, tz):
+    """
+    Computes the local timestamps of many blocks at once.
+
+    The timestamps are converted in a single vectorized operation and cached back into each block, along with the
+    timezone, so that further calls to `block.local_timestamp` do not need to convert them again while the timezone of
+    the node is the same.
+
+    :param blocks:
+        List of Block objects.
+
+    :param tz:
+        Timezone to convert the timestamps to.
+
+    :return:
+        DatetimeIndex with the local timestamp of each block.
+    """
+    seconds = np.fromiter((_timestamp_seconds(block._block_definition.get('local_timestamp', 0)) for block in blocks),
+                          dtype="int64", count=len(blocks))
+
+    timestamps = pd.to_datetime(seconds, unit='s', utc=True).tz_convert(tz)
+
+    for block, timestamp in zip(blocks, timestamps):
+        block._cached_ts = (tz, timestamp)
+
+    return timestamps
 
 
 class Block(NanoblocksClass):
@@ -12,6 +55,14 @@ class Block(NanoblocksClass):
 
     Gives an easy interface to access the metadata of the block.
     """
+    # Blocks are created by the thousands when walking account histories, so they do not carry a __dict__
+    __slots__ = ('_block_definition', '_account_owner', '_hash_cache', '_cached_ts', '_amount_cache')
+
+    # Hash of the first (initial) block of every account
+    _ZERO_HASH = "0" * 64
+
+    # SVG images of the HTML representations. They are invariant, so they are loaded once and shared by all blocks.
+    _svg_cache = {}
 
     def __init__(self, account, block_definition, nano_network):
         """
@@ -27,6 +78,21 @@ class Block(NanoblocksClass):
         super().__init__(nano_network)
         self._block_definition = block_definition
         self._account_owner = account
+        self._hash_cache = None
+        self._cached_ts = None
+        self._amount_cache = None
+
+    @staticmethod
+    def _svg(img_name):
+        """
+        Retrieves the given SVG image, loading it only on the first request.
+        """
+        svg = Block._svg_cache.get(img_name)
+
+        if svg is None:
+            svg = Block._svg_cache[img_name] = get_svg(img_name)
+
+        return svg
 
     @classmethod
     def from_dict(cls, dict_data, nano_network, initial_update=True):
@@ -133,6 +199,12 @@ class Block(NanoblocksClass):
         """
         Retrieves the local timestamp of this block.
         """
+        tz = self.node_backend.timezone
+        cached_ts = self._cached_ts
+
+        if cached_ts is not None and cached_ts[0] == tz:
+            return cached_ts[1]
+
         block_time = self._block_definition.get('local_timestamp', 0)
 
         if block_time == 'Unknown':
@@ -140,19 +212,47 @@ class Block(NanoblocksClass):
 
         m_datetime = pd.to_datetime(
             pd.Timestamp(int(block_time) * 1000000000).to_pydatetime()).tz_localize(
-            "UTC").tz_convert(self.node_backend.timezone)
+            "UTC").tz_convert(tz)
 
         return m_datetime
 
     @property
     def hash(self):
         """
-        Retrieves the hash of this block
+        Retrieves the hash of this block (hexadecimal string)
         """
-        return self.__hash__()
+        return self._block_definition.get('hash', 'Unknown')
 
     def __hash__(self):
-        return self._block_definition.get('hash', 'Unknown')
+        hash_cache = self._hash_cache
+
+        if hash_cache is None:
+            block_hash = self.hash
+
+            # Blocks without hash yet (not signed or not sent) are only equal to themselves. Their hash is not cached,
+            # as they get one once processed.
+            if block_hash == 'Unknown':
+                return id(self)
+
+            try:
+                hash_cache = int(block_hash, 16) & _HASH_MASK
+            except ValueError:
+                hash_cache = hash(block_hash)
+
+            self._hash_cache = hash_cache
+
+        return hash_cache
+
+    def __eq__(self, other):
+        if not isinstance(other, Block):
+            return NotImplemented
+
+        block_hash = self.hash
+
+        if block_hash == 'Unknown':
+            return self is other
+
+        return block_hash == other.hash
 
     @property
     def height(self):
@@ -169,4 +269,4 @@ class Block(NanoblocksClass):
         """
         Retrieves whether this block is the first (all 0s) or not
         """
-        return str(self.hash) == "0000000000000000000000000000000000000000000000000000000000000000"
+        return self.hash == self._ZERO_HASH
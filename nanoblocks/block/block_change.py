@@ -1,7 +1,6 @@
 from nanoblocks import rcParams
 from nanoblocks.block.block import Block
 from nanoblocks.ipython.html import get_html
-from nanoblocks.ipython.img import get_svg
 
 
 class BlockChange(Block):
@@ -9,6 +8,8 @@ class BlockChange(Block):
     Represents a representative change block.
     Gives an easy interface for change blocks.
     """
+    __slots__ = ()
+
     @property
     def representative(self):
         """
@@ -29,13 +30,13 @@ class BlockChange(Block):
             "account_address": self.account_owner.address,
             "block_type": self.subtype,
             "block_hash": self.hash,
-            "block_type_img": get_svg("block_receive"),
+            "block_type_img": self._svg("block_receive"),
             "block_num": self.height,
-            "copy_to_clipboard_image": get_svg("clipboard"),
+            "copy_to_clipboard_image": self._svg("clipboard"),
             "block_type_str": self.subtype,
             "new_representative_address": self.representative.address,
             "transaction_date": self.local_timestamp.strftime(date_format),
-            "confirmed_img": get_svg('confirmed') if self.confirmed else ""
+            "confirmed_img": self._svg('confirmed') if self.confirmed else ""
         })
 
         return formatted_template
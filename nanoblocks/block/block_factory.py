@@ -4,6 +4,7 @@ from nanoblocks.block.block_change import BlockChange
 from nanoblocks.block.block_receive import BlockReceive
 from nanoblocks.block.block_send import BlockSend
 from nanoblocks.block.block_state import BlockState
+from nanoblocks.currency import Amount
 
 
 class BlockFactory(NanoblocksClass):
@@ -17,7 +18,59 @@ class BlockFactory(NanoblocksClass):
         "unknown": Block,
     }
 
+    def __init__(self, nano_network):
+        super().__init__(nano_network)
+
+        # Bound lookup of the prototypes map, resolved once so that the build loop only pays a single call per block.
+        self._dispatch = dict(self.BLOCK_PROTO_MAP).get
+
     def build(self, account, block_definition, type_key='type'):
-        block_object = self.BLOCK_PROTO_MAP.get(block_definition.get(type_key, BlockChange), Block)
+        block_object = self._dispatch(block_definition.get(type_key, "unknown")) or Block
         block_instance = block_object(account, block_definition, nano_network=self.network)
         return block_instance
+
+    def build_many(self, account, block_definitions, type_key='type'):
+        """
+        Builds a list of blocks that belong to the same account owner, like the ones retrieved from an account history.
+
+        :param account:
+            Account owner of the blocks.
+
+        :param block_definitions:
+            Iterable of block definitions (dicts) as returned by the node.
+
+        :param type_key:
+            Key of the definitions that contains the block type.
+        """
+        block_definitions = list(block_definitions)
+        dispatch = self._dispatch
+        network = self.network
+
+        # Counterparty and representative accounts repeat a lot within a history page. They are resolved once per
+        # distinct address so that the accounts cache is updated once and later lookups of the blocks hit it.
+        self.accounts.lazy_fetch_many(address for block_definition in block_definitions
+                                      for address in (block_definition.get('account'),
+                                                      block_definition.get('representative'))
+                                      if address is not None)
+
+        # Amounts are parsed once per distinct raw value and shared by all the blocks that carry it.
+        amounts = {}
+        blocks = []
+        append = blocks.append
+
+        for block_definition in block_definitions:
+            block = (dispatch(block_definition.get(type_key, "unknown")) or Block)(account, block_definition,
+                                                                                   nano_network=network)
+            raw_amount = block_definition.get('amount')
+
+            if raw_amount is not None and type(block) in (BlockSend, BlockReceive):
+                amount = amounts.get(raw_amount)
+
+                if amount is None:
+                    amount = amounts[raw_amount] = Amount.of(raw_amount, unit="raw")
+
+                block._amount_cache = amount
+
+            append(block)
+
+        return blocks
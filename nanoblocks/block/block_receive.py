@@ -2,7 +2,6 @@ from nanoblocks import rcParams
 from nanoblocks.block.block import Block
 from nanoblocks.currency import Amount
 from nanoblocks.ipython.html import get_html
-from nanoblocks.ipython.img import get_svg
 
 
 class BlockReceive(Block):
@@ -11,6 +10,8 @@ class BlockReceive(Block):
 
     Gives an easy interface for receive blocks.
     """
+    __slots__ = ()
+
     @property
     def source_account(self):
         """
@@ -24,7 +25,10 @@ class BlockReceive(Block):
         """
         Retrieves the amount of Nano received.
         """
-        return Amount(self._block_definition['amount'], unit="raw")
+        if self._amount_cache is None:
+            self._amount_cache = Amount.of(self._block_definition['amount'], unit="raw")
+
+        return self._amount_cache
 
     def __str__(self):
         string = super().__str__()
@@ -34,21 +38,22 @@ class BlockReceive(Block):
     def _repr_html_(self):
         template_html = get_html("block_receive")
         date_format = rcParams["display.date_format"]
+        amount_nano = self.amount.as_unit("NANO")
 
         formatted_template = template_html.format(**{
             "account_address": self.account_owner.address,
             "block_type": self.subtype,
             "block_hash": self.hash,
-            "block_type_img": get_svg("block_receive"),
+            "block_type_img": self._svg("block_receive"),
             "block_num": self.height,
-            "copy_to_clipboard_image": get_svg("clipboard"),
+            "copy_to_clipboard_image": self._svg("clipboard"),
             "source_account": self.source_account.address,
             "block_type_str": self.subtype,
-            "amount_str": str(self.amount.as_unit("NANO")),
-            "amount": self.amount.as_unit("NANO").format(),
-            "total_balance_image": get_svg("total_balance"),
+            "amount_str": str(amount_nano),
+            "amount": amount_nano.format(),
+            "total_balance_image": self._svg("total_balance"),
             "transaction_date": self.local_timestamp.strftime(date_format),
-            "confirmed_img": get_svg('confirmed') if self.confirmed else ""
+            "confirmed_img": self._svg('confirmed') if self.confirmed else ""
         })
 
         return formatted_template
@@ -8,6 +8,7 @@ class BlockState(Block):
 
     Gives an easy interface for state blocks.
     """
+    __slots__ = ('_block_hash', '_str_cache')
 
     def __init__(self, account, block_definition, nano_network):
         """
@@ -25,14 +26,12 @@ class BlockState(Block):
         """
         super().__init__(account, block_definition, nano_network=nano_network)
         self._block_definition = block_definition
-
-        if 'hash' in block_definition:
-            self._block_hash = block_definition['hash']
-            del block_definition['hash']
-
+        self._block_hash = block_definition.pop('hash', 'Unknown')
         self._account_owner = account
+        self._str_cache = None
 
-    def __hash__(self):
+    @property
+    def hash(self):
         return self._block_hash
 
     @property
@@ -40,7 +39,7 @@ class BlockState(Block):
         """
         Retrieves the total balance of the account after block confirmation.
         """
-        result = Amount(self._block_definition['balance'], unit="raw")
+        result = Amount.of(self._block_definition['balance'], unit="raw")
 
         return result
 
@@ -67,6 +66,7 @@ class BlockState(Block):
     @work.setter
     def work(self, value):
         self._block_definition['work'] = value
+        self._str_cache = None
 
     @property
     def subtype(self):
@@ -77,10 +77,14 @@ class BlockState(Block):
         return self._block_definition['representative']
 
     def __str__(self):
-        string = super().__str__()
-        string += f"\tSubtype: {self.subtype}\n" + \
-                  f"\tLink: {self.link}\n" + \
-                  f"\tBalance: {self.balance}\n" + \
-                  f"\tSignature: {self.signature}\n" + \
-                  f"\tWork: {self.work}\n"
-        return string
+        # The work is the only field that can change once the block is built
+        if self._str_cache is None:
+            string = super().__str__()
+            string += f"\tSubtype: {self.subtype}\n" + \
+                      f"\tLink: {self.link}\n" + \
+                      f"\tBalance: {self.balance}\n" + \
+                      f"\tSignature: {self.signature}\n" + \
+                      f"\tWork: {self.work}\n"
+            self._str_cache = string
+
+        return self._str_cache
@@ -1,9 +1,18 @@
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from functools import partial
+from threading import Event
+
 from nanoblocks.base import NanoblocksClass
+from nanoblocks import rcParams
 from nanoblocks.block.block_factory import BlockFactory
 
 #TODO: expose exceptions in module __init__
 from nanoblocks.exceptions.block_error import BlockError
 from nanoblocks.exceptions.block_not_broadcastable_error import BlockNotBroadcastableError
+from nanoblocks.exceptions.broadcast_timeout_error import BroadcastTimeoutError
 
 # This is the first block in every uncreated account. It doesn't exist in the network.
 _FIRST_BLOCK_DEFINITION = {
@@ -39,6 +48,9 @@ class Blocks(NanoblocksClass):
         super().__init__(nano_network)
         self._factory = BlockFactory(nano_network)
 
+        # Hashes recently reported as not found by the node (hash -> monotonic expiration time)
+        self._miss_cache = OrderedDict()
+
     @property
     def factory(self):
         return self._factory
@@ -51,40 +63,146 @@ class Blocks(NanoblocksClass):
             Single hash or list of block hashes to retrieve from the network.
         """
 
-        if type(block_hashes) is not list:
+        if not isinstance(block_hashes, list):
             block_hashes = [block_hashes]
 
+        self._check_misses(block_hashes)
         response = self.node_backend.blocks_info(block_hashes, include_not_found=True)['blocks']
+        blocks = self._build_blocks(block_hashes, response)
+
+        return blocks[0] if len(blocks) == 1 and len(block_hashes) == 1 else blocks
+
+    def get_many(self, block_hashes):
+        """
+        Retrieves a list of blocks from the network.
+
+        Uses the batched `blocks_info` RPC. If the node does not support it, the blocks are requested one by one
+        through `block_info`, with up to `rcParams["rpc.max_concurrency"]` requests in flight at once.
+
+        :param block_hashes:
+            List of block hashes to retrieve from the network.
+        """
+        block_hashes = list(block_hashes)
+        self._check_misses(block_hashes)
+        response = self.node_backend.blocks_info(block_hashes, include_not_found=True)
+
+        if 'blocks' not in response:
+            with ThreadPoolExecutor(max_workers=rcParams["rpc.max_concurrency"]) as executor:
+                responses = executor.map(self.node_backend.block_info, block_hashes)
+                response = {'blocks': dict(zip(block_hashes, responses))}
+
+        return self._build_blocks(block_hashes, response['blocks'])
+
+    async def aget_many(self, block_hashes):
+        """
+        Asynchronous version of `get_many()`, for callers that already run inside an event loop.
+
+        The batched `blocks_info` RPC runs in the default executor. If the node does not support it, the blocks are
+        requested concurrently through `block_info`, with up to `rcParams["rpc.max_concurrency"]` requests in flight.
+
+        :param block_hashes:
+            List of block hashes to retrieve from the network.
+        """
+        block_hashes = list(block_hashes)
+        self._check_misses(block_hashes)
+        loop = asyncio.get_running_loop()
+
+        response = await loop.run_in_executor(None, partial(self.node_backend.blocks_info, block_hashes,
+                                                            include_not_found=True))
+
+        if 'blocks' not in response:
+            semaphore = asyncio.Semaphore(rcParams["rpc.max_concurrency"])
+
+            async def fetch(block_hash):
+                async with semaphore:
+                    return await loop.run_in_executor(None, self.node_backend.block_info, block_hash)
+
+            responses = await asyncio.gather(*(fetch(block_hash) for block_hash in block_hashes))
+            response = {'blocks': dict(zip(block_hashes, responses))}
+
+        return self._build_blocks(block_hashes, response['blocks'])
+
+    def _build_blocks(self, block_hashes, responses):
+        """
+        Builds the block objects for the given hashes out of their node responses.
+
+        :param block_hashes:
+            List of block hashes, in the order the blocks are wanted.
 
-        blocks = []
+        :param responses:
+            Dictionary of block hash -> block information as returned by the node.
+        """
+        first_hash = _FIRST_BLOCK_DEFINITION['block_hash']
+        definitions = []
+        append = definitions.append
 
         for block_hash in block_hashes:
 
-            if block_hash == _FIRST_BLOCK_DEFINITION['block_hash']:
+            if block_hash == first_hash:
                 response = _FIRST_BLOCK_DEFINITION
-                account = None
 
             else:
-                response = response[block_hash]
-                account = self.accounts.lazy_fetch(response['block_account'])
-
-            block_info = {
-                'type': response.get('subtype') or response.get('contents', {'type': 'Unknown'})['type'],
-                'confirmed': response.get('confirmed', False),
-                'account': response['block_account'],
-                'amount': response['amount'],
-                'local_timestamp': response['local_timestamp'],
-                'height': response['height'],
-                'link_as_account': response['contents'].get('link_as_account'),
-                'representative': response['contents'].get('representative'),
-                'hash': block_hash
-            }
-
-            blocks_factory = self.blocks.factory
-            block = blocks_factory.build(account, block_info)
-            blocks.append(block)
+                response = responses.get(block_hash)
 
-        return blocks[0] if len(blocks) == 1 and len(block_hashes) == 1 else blocks
+                if response is None or 'error' in response:
+                    self._register_miss(block_hash)
+                    raise KeyError(block_hash)
+
+            # The node response may be a cached answer (or the live storage of a virtual node) shared by other blocks,
+            # so each block gets its own shallow copy; only the keys the blocks read are added.
+            definition = dict(response)
+            contents = definition['contents']
+            definition['hash'] = block_hash
+            definition['type'] = definition.get('subtype') or contents.get('type', 'Unknown')
+            definition['account'] = definition['block_account']
+            definition['link_as_account'] = contents.get('link_as_account')
+            definition['representative'] = contents.get('representative')
+            definition.setdefault('confirmed', False)
+
+            append(definition)
+
+        # Owner accounts are resolved once per distinct address. The first block has no owner.
+        accounts = self.accounts.lazy_fetch_many(definition['block_account'] for definition in definitions
+                                                 if definition['hash'] != first_hash)
+        build = self._factory.build
+
+        blocks = [build(accounts.get(definition['block_account']), definition) for definition in definitions]
+
+        return blocks
+
+    def _check_misses(self, block_hashes):
+        """
+        Raises KeyError if any of the given hashes was recently reported as not found by the node.
+
+        Missing hashes are remembered for `rcParams["blocks.miss_cache.ttl_seconds"]` seconds, so that repeated requests
+        for a wrong hash do not hit the node every time, while still allowing the block to show up later.
+        """
+        miss_cache = self._miss_cache
+
+        if not miss_cache:
+            return
+
+        current_time = time.monotonic()
+
+        for block_hash in block_hashes:
+            expiration = miss_cache.get(block_hash)
+
+            if expiration is None:
+                continue
+
+            if expiration > current_time:
+                raise KeyError(block_hash)
+
+            del miss_cache[block_hash]
+
+    def _register_miss(self, block_hash):
+        miss_cache = self._miss_cache
+        miss_cache[block_hash] = time.monotonic() + rcParams["blocks.miss_cache.ttl_seconds"]
+        miss_cache.move_to_end(block_hash)
+        max_size = rcParams["blocks.miss_cache.max_size"]
+
+        while len(miss_cache) > max_size:
+            miss_cache.popitem(last=False)
 
     def __len__(self):
         """
@@ -151,12 +269,71 @@ class Blocks(NanoblocksClass):
             raise BlockError(response['error'], block=block)
 
         block_hash = response['hash']
+        self._miss_cache.pop(block_hash, None)
         block_result = self[block_hash]
         account = block.account_owner
         account.offline_update_by_block(block)
 
         return block_result
 
+    def broadcast_many(self, blocks):
+        """
+        Broadcasts the given blocks to the network and returns the processed blocks, in the same order.
+
+        Blocks of the same account are chained by hash, so they are broadcasted sequentially in the given order. Blocks
+        of different accounts are broadcasted concurrently, up to `rcParams["rpc.broadcast_concurrency"]` accounts at
+        once. The same rules of `broadcast()` regarding the account objects apply here.
+
+        If the whole operation takes longer than `rcParams["rpc.broadcast_timeout"]` seconds, the blocks not sent yet
+        are discarded and a BroadcastTimeoutError is raised. It tells which blocks were broadcasted and which ones were
+        in flight, whose outcome is unknown.
+
+        :param blocks:
+            List of Block Status to broadcast to the network.
+        """
+        blocks = list(blocks)
+        results = [None] * len(blocks)
+        chains = {}
+        in_flight = set()
+        stop = Event()
+
+        for index, block in enumerate(blocks):
+            chains.setdefault(block.account_owner.address, []).append(index)
+
+        def broadcast_chain(indexes):
+            for index in indexes:
+                # A process call in flight can't be taken back, but the rest of the chain is not sent after a timeout
+                if stop.is_set():
+                    return
+
+                in_flight.add(index)
+                results[index] = self.broadcast(blocks[index])
+                in_flight.discard(index)
+
+        executor = ThreadPoolExecutor(max_workers=rcParams["rpc.broadcast_concurrency"])
+        futures = []
+
+        try:
+            futures = [executor.submit(broadcast_chain, indexes) for indexes in chains.values()]
+
+            for future in as_completed(futures, timeout=rcParams["rpc.broadcast_timeout"]):
+                future.result()
+
+        except FuturesTimeoutError:
+            stop.set()
+
+            raise BroadcastTimeoutError(f"Blocks not broadcasted in time ({rcParams['rpc.broadcast_timeout']} seconds).",
+                                        results=list(results), unknown=sorted(in_flight)) from None
+
+        finally:
+            # Chains not started yet are cancelled (equivalent to shutdown(cancel_futures=True), Python 3.9+)
+            for future in futures:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+        return results
+
     def __repr__(self):
         blocks_info = self._blocks_telemetry()
         return f"Blocks ({str(self.network.node_backend)})\n\tBlocks count: {blocks_info['count']}; Unchecked: " \
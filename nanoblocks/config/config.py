@@ -12,6 +12,70 @@ rcParams = {
     # Interval in seconds to purge expired keys from the cache
     "global.cache.expiration_interval_seconds": 100,
 
+    # Path of a sqlite file where slow-changing node answers (version, supply, representatives) are kept between
+    # processes. None disables the persistent cache
+    "global.cache.persist_path": None,
+
     # Number of seconds to consider a timeout when requesting with requests module
     "requests.timeout": 5,
+
+    # Number of seconds to wait for the connection to be established when requesting with requests module
+    "requests.connect_timeout": 3.05,
+
+    # Maximum number of connections kept open with each remote node, to serve concurrent requests
+    "requests.pool_size": 16,
+
+    # Number of times a request to a remote node is retried when the connection fails or the node answers with a
+    # server error
+    "requests.max_retries": 2,
+
+    # Upper limit of the random wait before the first retry of a request; the limit doubles on every further retry
+    "requests.backoff_seconds": 0.1,
+
+    # Maximum upper limit of the random wait between retries of a request
+    "requests.max_backoff_seconds": 5,
+
+    # Whether remote nodes are reached through HTTP/2 (multiplexing concurrent requests over a single connection)
+    # instead of HTTP/1.1. Requires the optional httpx package with HTTP/2 support (pip install httpx[http2])
+    "requests.http2": False,
+
+    # Whether websocket messages are compressed (permessage-deflate). Confirmations are small JSON messages, for which
+    # compressing costs more CPU than the bandwidth it saves
+    "websocket.compression": False,
+
+    # Seconds waited before opening again a websocket connection closed by the node; the wait doubles after every
+    # failed attempt, up to the maximum
+    "websocket.reconnect_backoff_seconds": 0.5,
+    "websocket.max_reconnect_backoff_seconds": 30,
+
+    # Number of seconds a failover node that failed a health check is skipped before probing it again
+    "failover.health_cache_seconds": 5,
+
+    # Number of attempts of a request through a failover node before giving up
+    "failover.max_attempts": 6,
+
+    # Seconds waited before the second attempt of a failover request; the wait doubles on every further attempt
+    "failover.backoff_seconds": 0.1,
+
+    # Maximum seconds waited between two attempts of a failover request
+    "failover.max_backoff_seconds": 2.0,
+
+    # Maximum number of concurrent RPC requests when a batch call has to be split into single calls
+    "rpc.max_concurrency": 8,
+
+    # Maximum number of items (accounts, hashes) sent in a single request; longer lists are split in several requests
+    "rpc.chunk_size": 500,
+
+    # Maximum number of blocks requested in a single blocks_info call when taking a snapshot
+    "rpc.blocks_info_chunk_size": 256,
+
+    # Maximum number of accounts whose blocks are broadcasted concurrently by blocks.broadcast_many()
+    "rpc.broadcast_concurrency": 4,
+
+    # Number of seconds to wait for blocks.broadcast_many() to finish
+    "rpc.broadcast_timeout": 60,
+
+    # Seconds to remember a block hash that the node reported as not found, and max number of hashes remembered
+    "blocks.miss_cache.ttl_seconds": 60,
+    "blocks.miss_cache.max_size": 10000,
 }
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 MAX_SUPPLY_RAW = "340282366920938463463374607431768211455"
 
@@ -14,9 +15,44 @@ REPRESENTATIONS = {
     "raw": 1,
 }
 
+# Number of decimal digits of each unit, expressed in raw
+_EXPONENTS = {unit: len(str(value)) - 1 for unit, value in REPRESENTATIONS.items()}
+
+# Number of digits of the integer part of the max supply, on each unit
+_INTEGER_WIDTHS = {unit: len(MAX_SUPPLY_RAW) - exponent for unit, exponent in _EXPONENTS.items()}
+
+AMOUNT_STRING_REGEX = r"([0-9.]+)([A-z ]+)"
+_AMOUNT_RE = re.compile(AMOUNT_STRING_REGEX, re.I)
+
+
+def _raw(amount):
+    """
+    Retrieves the raw integer value of the given amount, wrapping it into an Amount only if required.
+
+    Plain integers are taken as NANO units, as the Amount constructor does.
+    """
+    amount_type = type(amount)
+
+    if amount_type is Amount:
+        return amount._value
+
+    if amount_type is int:
+        return _non_negative(amount * REPRESENTATIONS["NANO"])
+
+    return Amount(amount)._value
+
+
+def _non_negative(raw_value):
+    if raw_value < 0:
+        raise ValueError("Negative amounts not supported.")
+
+    return raw_value
+
 
 class Amount:
-    AMOUNT_STRING_REGEX = r"([0-9.]+)([A-z ]+)"
+    __slots__ = ('_value', '_representation_unit')
+
+    AMOUNT_STRING_REGEX = AMOUNT_STRING_REGEX
 
     def __init__(self, raw_input, unit=None):
         """
@@ -66,18 +102,39 @@ class Amount:
     @staticmethod
     def _decimal(comma_string, unit=None):
 
-        if type(comma_string) is Amount:
+        if isinstance(comma_string, Amount):
             unit = unit if unit is not None else comma_string.unit
             return comma_string._value, unit
 
-        if type(comma_string) in [float, int]:
+        # Exact type check on purpose: bool is a subclass of int but is not a valid amount
+        if type(comma_string) is int:
+            unit = unit if unit is not None else "NANO"
+            representation_unit_val = REPRESENTATIONS.get(unit, None)
+
+            if representation_unit_val is None:
+                raise ValueError(
+                    f"'{unit}' is not a valid representation unit. The allowed representations are: {list(REPRESENTATIONS)}")
+
+            return _non_negative(comma_string * representation_unit_val), unit
+
+        if isinstance(comma_string, float):
             comma_string = str(comma_string)
 
+        elif type(comma_string) is not str:
+            raise TypeError(f"Amounts can't be built from {type(comma_string).__name__} values.")
+
+        # Raw digit strings are what the node returns for every amount and balance
+        if unit == "raw" and comma_string.isdigit():
+            return int(comma_string), unit
+
         if "-" in comma_string:
             raise ValueError("Negative amounts not supported.")
 
-        # First we try to seek for the unit text (in case)
-        match = re.match(Amount.AMOUNT_STRING_REGEX, comma_string, re.I)
+        # First we try to seek for the unit text (in case). Plain numbers can't contain it.
+        if comma_string.replace(".", "", 1).isdigit():
+            match = None
+        else:
+            match = _AMOUNT_RE.match(comma_string)
 
         if match:
             comma_string, unit_detected = match.groups()
@@ -94,25 +151,34 @@ class Amount:
             raise ValueError(
                 f"'{unit}' is not a valid representation unit. The allowed representations are: {list(REPRESENTATIONS)}")
 
-        if "." not in comma_string:
-            comma_string = comma_string + ".0"
-
         comma_string_split = comma_string.split(".")
 
         integer = comma_string_split[0]
-        decimals = comma_string_split[1]
+        decimals = comma_string_split[1] if len(comma_string_split) > 1 else ""
 
-        # We transform the comma_string under the unit representation into RAW
-        zeros_remaining_right = len(str(representation_unit_val)) - len(decimals) - 1
-        raw_value = f'{integer}{decimals[:zeros_remaining_right]}{"0" * zeros_remaining_right}'
+        # We transform the comma_string under the unit representation into RAW. Decimals beyond the unit precision
+        # are truncated.
+        exponent = _EXPONENTS[unit]
+        raw_value = int(integer or 0) * representation_unit_val + int(decimals[:exponent].ljust(exponent, "0") or 0)
 
-        zeros_remaining_left = len(MAX_SUPPLY_RAW) - len(raw_value)
-        raw_value = f'{"0" * zeros_remaining_left}{raw_value}'
+        return raw_value, unit
 
-        if unit == "raw" and "." in raw_value:
-            raw_value = raw_value.split(".")[0]
+    @classmethod
+    def of(cls, raw_input, unit=None):
+        """
+        Retrieves a shared Amount instance for the given input.
 
-        return raw_value, unit
+        Block and account amounts repeat a lot (zero amounts in change blocks, the same balance across several
+        blocks), so the most recent ones are kept and returned again instead of being parsed each time. Amounts are
+        never modified in place, hence sharing them is safe.
+
+        Accepts the same parameters as the constructor.
+        """
+        try:
+            return _shared_amount(raw_input, unit)
+        except TypeError:
+            # Unhashable input, like another Amount
+            return cls(raw_input, unit=unit)
 
     @classmethod
     def from_value(cls, value, unit):
@@ -124,7 +190,7 @@ class Amount:
         return Amount.from_value(self._value, unit=new_unit)
 
     def __str__(self):
-        return str(int(self._value))
+        return str(self._value)
 
     def format(self, show_unit=True, squeeze_zeros=True):
         representation_unit_val = REPRESENTATIONS.get(self._representation_unit, None)
@@ -132,18 +198,16 @@ class Amount:
         if representation_unit_val is None:
             raise ValueError("Representation unit not valid. Amount object is bad constructed.")
 
-        comma_position = len(MAX_SUPPLY_RAW) - (len(str(representation_unit_val)) - 1)
-
-        if comma_position == 38:
-            comma_position = 39
-
-        integer = self._value[:comma_position]
-        decimal = self._value[comma_position:]
+        exponent = _EXPONENTS[self._representation_unit]
+        integer, decimal = divmod(self._value, representation_unit_val)
+        decimal = f"{decimal:0{exponent}d}" if exponent > 0 else ""
 
         if squeeze_zeros:
-            integer = str(int(integer))
+            integer = str(integer)
             if decimal != "":
-                decimal = str(int(decimal[::-1]))[::-1]
+                decimal = decimal.rstrip("0") or "0"
+        else:
+            integer = str(integer).zfill(_INTEGER_WIDTHS[self._representation_unit])
 
         result = f"{integer}"
 
@@ -161,43 +225,43 @@ class Amount:
         # ARITHMETIC OPERATIONS
 
     def __add__(self, add_with):
-        return Amount(int(self._value) + int(Amount(add_with)._value), unit="raw").as_unit(self._representation_unit)
+        return Amount.from_value(self._value + _raw(add_with), unit=self._representation_unit)
 
     def __sub__(self, sub_with):
-        return Amount(int(self._value) - int(Amount(sub_with)._value), unit="raw").as_unit(self._representation_unit)
+        return Amount.from_value(_non_negative(self._value - _raw(sub_with)), unit=self._representation_unit)
 
     def __mul__(self, mul_with):
-        return Amount(int(self._value) * mul_with, unit="raw").as_unit(self._representation_unit)
+        return Amount.from_value(_non_negative(int(self._value * mul_with)), unit=self._representation_unit)
 
     def __floordiv__(self, div_with):
-        return Amount(int(self._value) // div_with, unit="raw").as_unit(self._representation_unit)
+        return Amount.from_value(_non_negative(int(self._value // div_with)), unit=self._representation_unit)
 
     def __truediv__(self, div_with):
         return self.__floordiv__(div_with)
 
     def __mod__(self, other):
-        return Amount(int(self._value) % other, unit="raw").as_unit(self._representation_unit)
+        return Amount.from_value(_non_negative(int(self._value % other)), unit=self._representation_unit)
 
     def __pow__(self, exponent):
         raise NotImplementedError("Pow operation not supported on amounts.")
 
     def __lt__(self, other):
-        return int(self._value) < int(Amount(other)._value)
+        return self._value < _raw(other)
 
     def __le__(self, other):
-        return int(self._value) <= int(Amount(other)._value)
+        return self._value <= _raw(other)
 
     def __eq__(self, other):
-        return int(self._value) == int(Amount(other)._value)
+        return self._value == _raw(other)
 
     def __ne__(self, other):
-        return int(self._value) != int(Amount(other)._value)
+        return self._value != _raw(other)
 
     def __gt__(self, other):
-        return int(self._value) > int(Amount(other)._value)
+        return self._value > _raw(other)
 
     def __ge__(self, other):
-        return int(self._value) >= int(Amount(other)._value)
+        return self._value >= _raw(other)
 
     def clone(self):
         return Amount(self)
@@ -230,12 +294,8 @@ class Amount:
         if expected_bytes is None:
             expected_bytes = 0
 
-        d = int(self._value)
-        result = ""
-        decimal_map = list("0123456789ABCDEF")
+        return (format(self._value, "X") if self._value > 0 else "").zfill(expected_bytes * 2)
 
-        while d > 0:
-            result += decimal_map[int(d % 16)]
-            d //= 16
 
-        return result[::-1].zfill(expected_bytes * 2)
+# Typed, so that True, 1 and 1.0 are not taken as the same input
+_shared_amount = lru_cache(maxsize=1024, typed=True)(Amount)
@@ -0,0 +1,14 @@
+
+class BroadcastTimeoutError(TimeoutError):
+    """
+    Raised when broadcasting several blocks does not finish in time.
+
+    Its attribute `results` holds, for each of the given blocks and in the same order, the processed block or None if
+    it was not broadcasted. The attribute `unknown` lists the indexes of the blocks whose broadcast was in flight: they
+    may have reached the network or not.
+    """
+
+    def __init__(self, message, results, unknown):
+        super().__init__(message)
+        self.results = results
+        self.unknown = unknown
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pkg_resources
 
 HTML = {
@@ -8,5 +10,6 @@ HTML = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_html(html_name):
     return str(pkg_resources.resource_stream('nanoblocks', HTML[html_name]).read(), "utf-8")
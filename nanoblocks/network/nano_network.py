@@ -1,8 +1,10 @@
+import asyncio
 from contextlib import contextmanager
 
 from nanoblocks.block import Blocks
 from nanoblocks.account import Accounts
 from nanoblocks.currency import Amount
+from nanoblocks.network.representatives import Representatives
 from nanoblocks.node import PUBLIC_FAILOVER_NODE
 from nanoblocks.work import LOCAL_WORK_SERVER
 from nanoblocks.wallet import Wallets
@@ -12,6 +14,8 @@ class NanoNetwork:
     """
     This class represents the Nano network and provides methods to easily interact with it.
     """
+    __slots__ = ('_node_backend', '_work_server', '_accounts', '_wallets', '_blocks')
+
     def __init__(self, node_backend=PUBLIC_FAILOVER_NODE, work_server=LOCAL_WORK_SERVER, cache_accounts=True):
         """
         Creates an object that allows interaction with the Nano network through the specified node backend
@@ -147,16 +151,12 @@ class NanoNetwork:
     @property
     def representatives(self):
         """
-        Returns a list of representatives accounts of the network.
+        Returns the representatives accounts of the network, as a read-only mapping of {nano_address: Account}.
+        The accounts are only created when accessed.
         """
-        representatives = self._node_backend.representatives()
-
-        representative_accounts = self.accounts[list(representatives)]
+        representatives = self._node_backend.representatives()['representatives']
 
-        for (representative_address, weight_value), representative_account in zip(representatives.items(), representative_accounts):
-            representative_account._account_info['weight'] = weight_value
-
-        return representative_accounts
+        return Representatives(self, representatives)
 
     @property
     def representatives_count(self):
@@ -168,24 +168,47 @@ class NanoNetwork:
     @property
     def representatives_online(self):
         """
-        Returns a list of online representatives accounts of the network.
-        The ones that recently voted.
+        Returns the online representatives accounts of the network (the ones that recently voted), as a read-only
+        mapping of {nano_address: Account}. The accounts are only created when accessed.
         """
         representatives = self._node_backend.representatives_online()['representatives']
+        weights = {address: weight_value['weight'] for address, weight_value in representatives.items()}
 
-        representative_accounts = self.accounts[list(representatives)]
-
-        for (representative_address, weight_value), representative_account in zip(representatives.items(), representative_accounts):
-            representative_account._account_info['weight'] = weight_value  #weight_obj['weight']
-
-        return representative_accounts
+        return Representatives(self, weights)
 
     @property
     def representatives_online_count(self):
         """
         Retrieves the number of online representatives in the network.
         """
-        return len(self._node_backend.representatives_online(weight=False)['representatives'])
+        # Same request as `representatives_online`, so that the node backend answers both from its cache
+        return len(self._node_backend.representatives_online()['representatives'])
+
+    async def gather(self, *properties):
+        """
+        Retrieves several properties of the network concurrently, so that the node requests overlap instead of
+        running one after the other.
+
+        Usage example:
+            >>> available_supply, peers, telemetry = await nano_network.gather("available_supply", "peers", "telemetry")
+
+        Or from synchronous code:
+            >>> available_supply, peers = asyncio.run(nano_network.gather("available_supply", "peers"))
+
+        :param properties:
+            Names of the properties to retrieve. Methods without parameters (like "active_dificulty") are also allowed.
+
+        :return:
+            List with the value of each property, in the same order.
+        """
+        def fetch(property_name):
+            value = getattr(self, property_name)
+            return value() if callable(value) else value
+
+        loop = asyncio.get_running_loop()
+
+        return await asyncio.gather(*(loop.run_in_executor(None, fetch, property_name)
+                                      for property_name in properties))
 
     def __str__(self):
         return f"[Nano Network] {len(self)} peers; {len(self.accounts)} accounts; node backend: \n {str(self._node_backend)}"
@@ -0,0 +1,92 @@
+from collections.abc import Mapping
+
+from nanoblocks.base import NanoblocksClass
+
+
+class Representatives(NanoblocksClass, Mapping):
+    """
+    Read-only view of representative accounts of the network, indexed by address.
+
+    The node answer for the representatives may contain thousands of entries, while callers usually inspect just a
+    few. Hence, the account objects are only created when accessed (and reused on further accesses). The number of
+    representatives and their weights are available without creating any account.
+
+    Usage example:
+        >>> representatives = nano_network.representatives
+        >>> len(representatives)
+        >>> account = representatives["nano_..."]
+        >>> for address, account in representatives.items():
+        ...     print(address, account.weight)
+    """
+
+    def __init__(self, nano_network, weights):
+        """
+        Constructor of the class
+
+        :param nano_network:
+            A network object giving access to node and work backends.
+
+        :param weights:
+            Dictionary of {nano_address: weight in raw} as returned by the node.
+        """
+        super().__init__(nano_network)
+        self._weights = weights
+        self._accounts = {}
+
+    @property
+    def weights(self):
+        """
+        Retrieves the dictionary {nano_address: weight in raw} of the representatives.
+        """
+        return dict(self._weights)
+
+    def update(self):
+        """
+        Retrieves the balance, pending and frontier of every representative from the node at once.
+
+        All the accounts are requested in a single bulk call instead of one call per account.
+
+        :return:
+            This same object, to allow chaining calls.
+        """
+        accounts = self.accounts[list(self._weights)]
+
+        for nano_address, account in accounts.items():
+            # noinspection PyProtectedMember
+            if account._account_info.get('weight') != self._weights[nano_address]:
+                account.offline_update({'weight': self._weights[nano_address]})
+
+        self._accounts.update(accounts)
+        return self
+
+    def __getitem__(self, nano_address):
+        account = self._accounts.get(nano_address)
+
+        if account is None:
+            weight = self._weights[nano_address]
+
+            account = self.accounts.lazy_fetch(nano_address)
+
+            # Cached accounts may already hold this weight
+            # noinspection PyProtectedMember
+            if account._account_info.get('weight') != weight:
+                account.offline_update({'weight': weight})
+
+            self._accounts[nano_address] = account
+
+        return account
+
+    def __iter__(self):
+        return iter(self._weights)
+
+    def __len__(self):
+        return len(self._weights)
+
+    def __contains__(self, nano_address):
+        return nano_address in self._weights
+
+    def __repr__(self):
+        return f"Representatives ({len(self)} accounts)"
+
+    def __str__(self):
+        return self.__repr__()
@@ -1,11 +1,30 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
+
+from nanoblocks import rcParams
 from nanoblocks.exceptions.no_healthy_nodes_available import NoHealthyNodesAvailable
 from nanoblocks.exceptions.node_limit_reached import NodeLimitReached
 from nanoblocks.exceptions.node_timedout import NodeTimedOut
 from nanoblocks.exceptions.node_unreachable import NodeUnreachable
 from nanoblocks.node import NodeRemote
+from nanoblocks.node.node_remote import _is_idempotent
+from nanoblocks.utils.method_cache import clear_cache
 from nanoblocks.utils.time import SYSTEM_TIMEZONE
 
 
+def _known_vendor(node):
+    # Vendor of the node from its last cached version answer, without requesting it
+    try:
+        found, version = type(node).version.fget.peek(node)
+
+    except AttributeError:
+        return None
+
+    return version.get('node_vendor') if found and type(version) is dict else None
+
+
 class NodeFailover(NodeRemote):
     """
     A Node Failover is node class that forwards its requests to the first healthy node in a list of failover nodes.
@@ -16,6 +35,7 @@ class NodeFailover(NodeRemote):
     """
     # Inheriting the docstrings from the NodeRemote
     __doc__ = NodeRemote.__doc__ + (__doc__ if __doc__ is not None else "")
+    __slots__ = ('_nodes_list', '_target_node', '_target_lock', '_unhealthy_nodes', '_healthy_nodes')
 
     def __init__(self, nodes_list, timezone=SYSTEM_TIMEZONE):
         """
@@ -23,13 +43,30 @@ class NodeFailover(NodeRemote):
 
         This class behaves like a node, but it forwards the requests to the first healthy node in the nodes list.
 
+        The healthy node is not searched until the first request (or the first access to `target_node`), so that
+        creating a failover node does not block nor require connectivity.
+
         :param nodes_list:
             list of nodes to use as failover.
         """
         super().__init__(http_url=None, ws_url=None, timezone=SYSTEM_TIMEZONE)
         self._nodes_list = list(nodes_list)
         self._target_node = None
-        self.find_healthy()
+        self._target_lock = RLock()
+        self._unhealthy_nodes = {}
+        self._healthy_nodes = {}
+
+    @property
+    def target_node(self):
+        """
+        Retrieves the node that is answering the requests, searching for a healthy one if none was chosen yet.
+        """
+        if self._target_node is None:
+            with self._target_lock:
+                if self._target_node is None:
+                    self.find_healthy()
+
+        return self._target_node
 
     @property
     def failover_nodes(self):
@@ -41,47 +78,75 @@ class NodeFailover(NodeRemote):
     def remove_failover_node(self, failover_node):
         try:
             self._nodes_list.remove(failover_node)
-            self.find_healthy()
         except ValueError:  # We dont have the node in the list
-            pass
+            return
+
+        # A new target is searched on the next request
+        if failover_node is self._target_node:
+            self._target_node = None
+
+    def close(self):
+        """
+        Closes the connections kept open with every node of the failover list.
+        """
+        for node in self._nodes_list:
+            if hasattr(node, "close"):
+                node.close()
+
+        super().close()
 
     @property
     def http_url(self):
-        return self._target_node.http_url
+        return self.target_node.http_url
 
     @property
     def ws_url(self):
-        return self._target_node.ws_url
+        return self.target_node.ws_url
 
     @property
     def ws(self):
-        if self._target_node is None:
+        return self.target_node.ws
+
+    @property
+    def _cache_namespace(self):
+        # Any remote node of the list may answer, so the answers are identified by all of them. Nodes without a
+        # namespace (like the virtual NO_NODE kept as a last resort) are left out. Building it must not search for a
+        # healthy node.
+        # noinspection PyProtectedMember
+        namespaces = [getattr(node, "_cache_namespace", None) for node in self._nodes_list]
+        namespaces = [namespace for namespace in namespaces if namespace is not None]
+
+        if len(namespaces) == 0:
             return None
 
-        return self._target_node.ws
+        return "failover:" + ",".join(namespaces)
 
     def __str__(self):
-
+        # Built only from the results of the last health probes: printing the failover never contacts the nodes.
         nodes_info = []
 
         for node in self._nodes_list:
-            if node == self._target_node:
+            if node is self._target_node:
                 node_info = "\t[x] "
             else:
                 node_info = "\t[ ] "
 
-            try:
-                nodes_info.append(node_info + str(node))
+            node_info += f"[Node http={node.http_url}"
 
-            except (NodeTimedOut, NodeUnreachable, NodeLimitReached) as e:
-                node_info += f"[Node http={node.http_url}"
+            if node.ws_url is not None:
+                node_info += f"; ws={node.ws_url}"
 
-                if node.ws_url is not None:
-                    node_info += f"; ws={node.ws_url}]"
-                else:
-                    node_info += "]"
+            if node in self._healthy_nodes:
+                vendor = _known_vendor(node)
+                node_info += f" ({vendor})]" if vendor is not None else "]"
 
-                nodes_info.append(node_info)
+            elif node in self._unhealthy_nodes:
+                node_info += "] [unreachable]"
+
+            else:
+                node_info += "]"
+
+            nodes_info.append(node_info)
 
         base_str = "\n".join([f"[FAILOVER NODE]", ] + nodes_info)
         return base_str
@@ -90,15 +155,79 @@ class NodeFailover(NodeRemote):
         """
         Seeks for a healthy node in the list of nodes.
         When a node is found, it is set as the target node of this instance.
-        :return:
+
+        All the nodes are probed at the same time, so a slow or unreachable node only delays the search by its own
+        timeout. The node chosen is still the first healthy one in the list order. Nodes found unhealthy are not probed
+        again for `rcParams["failover.health_cache_seconds"]` seconds.
         """
-        for node in self._nodes_list:
-            if node.healthy() and node.ws.healthy():
-                self._target_node = node
-                return
+        nodes = list(self._nodes_list)
+
+        if len(nodes) > 0:
+            executor = ThreadPoolExecutor(max_workers=len(nodes))
+
+            try:
+                probes = [executor.submit(self._probe, node) for node in nodes]
+
+                for node, probe in zip(nodes, probes):
+                    # The websocket is kept open once started, so it is only checked for the node about to be chosen
+                    if probe.result() and self._probe_websocket(node):
+                        if node is not self._target_node:
+                            self._target_node = node
+
+                            # Cached answers belong to the previous node
+                            clear_cache(self)
+
+                        return
+
+            finally:
+                executor.shutdown(wait=False)
 
         raise NoHealthyNodesAvailable("No healthy nodes available in the failover list.")
 
+    def _probe(self, node):
+        """
+        Checks whether the given node is healthy.
+        """
+        unhealthy_since = self._unhealthy_nodes.get(node)
+
+        if unhealthy_since is not None and time.monotonic() - unhealthy_since < rcParams["failover.health_cache_seconds"]:
+            return False
+
+        try:
+            healthy = node.healthy()
+
+        except Exception:
+            # A failing probe must not abort the search through the rest of the nodes
+            healthy = False
+
+        self._register_health(node, healthy)
+        return healthy
+
+    def _probe_websocket(self, node):
+        """
+        Checks whether the websocket of the given node (if any) is healthy.
+        """
+        try:
+            # Virtual nodes have no websocket
+            ws = node.ws
+            healthy = ws is None or ws.healthy()
+
+        except Exception:
+            healthy = False
+
+        if not healthy:
+            self._register_health(node, healthy)
+
+        return healthy
+
+    def _register_health(self, node, healthy):
+        if healthy:
+            self._unhealthy_nodes.pop(node, None)
+            self._healthy_nodes[node] = time.monotonic()
+        else:
+            self._healthy_nodes.pop(node, None)
+            self._unhealthy_nodes[node] = time.monotonic()
+
     def _ask(self, message):
         """
         Makes a call to the rest api with the specified message and returns the result.
@@ -108,15 +237,60 @@ class NodeFailover(NodeRemote):
         :param message:
             A crafted JSON message.
         """
-        response = None
+        # noinspection PyProtectedMember
+        return self._ask_failover(lambda node: node._ask(message), idempotent=_is_idempotent(message))
+
+    def _ask_batch(self, messages):
+        """
+        Makes a single call to the rest api with a list of messages and returns the list of results, in order.
+
+        If a node fails answering, a new node from the failover list is taken automatically.
+
+        :param messages:
+            List of crafted JSON messages.
+        """
+        # noinspection PyProtectedMember
+        return self._ask_failover(lambda node: node._ask_batch(messages),
+                                  idempotent=all(_is_idempotent(message) for message in messages))
+
+    def _ask_failover(self, request, idempotent=True):
+        """
+        Performs the given request against the target node, switching to another healthy node when it fails.
+
+        The request is attempted up to `rcParams["failover.max_attempts"]` times, waiting a random time between
+        attempts up to an exponentially growing limit (starting at `rcParams["failover.backoff_seconds"]` and limited
+        to `rcParams["failover.max_backoff_seconds"]`). A node answering nothing (None) is considered a failure.
+
+        :param request:
+            Function that receives the target node and returns its answer.
+
+        :param idempotent:
+            Whether the request can be repeated safely. Requests that change the state of the network (like `process`)
+            may have been applied by a node that failed to answer, so they are attempted only once: sending them to
+            other nodes could publish them twice.
+        """
+        max_attempts = rcParams["failover.max_attempts"] if idempotent else 1
+        backoff_seconds = rcParams["failover.backoff_seconds"]
+        max_backoff_seconds = rcParams["failover.max_backoff_seconds"]
+
+        for attempt in range(max_attempts):
+            if attempt > 0:
+                # Random waits (full jitter) keep many clients from retrying at the same time
+                time.sleep(random.uniform(0, min(backoff_seconds * 2 ** (attempt - 1), max_backoff_seconds)))
 
-        while response is None:
-            # A response is tried until no healthy nodes are available.
             try:
-                # noinspection PyProtectedMember
-                response = self._target_node._ask(message)
+                if attempt > 0:
+                    self.find_healthy()
+
+                response = request(self.target_node)
+
+            except (NodeTimedOut, NodeUnreachable, NodeLimitReached, NoHealthyNodesAvailable):
+                if not idempotent:
+                    raise
+
+                continue
 
-            except (NodeTimedOut, NodeUnreachable, NodeLimitReached) as e:
-                self.find_healthy()
+            if response is not None:
+                return response
 
-        return response
+        raise NoHealthyNodesAvailable(f"No healthy node answered the request after {max_attempts} attempts.")
@@ -1,9 +1,12 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import partial
 
-import numpy as np
-
+from nanoblocks import rcParams
 from nanoblocks.node.snapshot import NodeSnapshot
 from nanoblocks.node.tape_record import TapeRecord
+from nanoblocks.utils.method_cache import clear_cache
 from nanoblocks.utils.time import SYSTEM_TIMEZONE, now
 
 
@@ -11,6 +14,8 @@ class NodeInterface:
     """
     Interface access to a Node.
     """
+    # Nodes are reached on every request; the cache decorator stores its entries in `_cachemod_internal_cache`
+    __slots__ = ('_timezone', '_tape_record', '_cachemod_internal_cache', '__weakref__')
 
     def __init__(self, timezone=SYSTEM_TIMEZONE):
         self._timezone = timezone
@@ -219,6 +224,47 @@ class NodeInterface:
 
         raise NotImplementedError()
 
+    def accounts_info(self, addresses, representative=False, weight=False, pending=True, include_confirmed=False):
+        """
+        Returns the `account_info()` response for every account of a list, as a dictionary {address: response}.
+
+        Backends able to do so retrieve all of them in a single request.
+
+        :param addresses:
+            List of "NANO_..." addresses.
+
+        For the rest of parameters, check `account_info()`.
+        """
+        return {address: self.account_info(address, representative=representative, weight=weight, pending=pending,
+                                           include_confirmed=include_confirmed)
+                for address in addresses}
+
+    def accounts_history(self, addresses, count=10):
+        """
+        Returns the `account_history()` response for every account of a list, as a dictionary {address: response}.
+
+        Backends able to do so retrieve all of them in a single request.
+
+        :param addresses:
+            List of "NANO_..." addresses.
+
+        :param count:
+            Number of blocks to retrieve for each account. -1 retrieves the whole history.
+        """
+        return {address: self.account_history(nano_address=address, count=count) for address in addresses}
+
+    def accounts_balances_frontiers(self, addresses):
+        """
+        Returns both the balances and the frontiers of an accounts list, as a tuple with the responses of
+        `accounts_balances()` and `accounts_frontiers()`.
+
+        Backends able to do so retrieve both in a single request.
+
+        :param addresses:
+            List of "NANO_..." addresses.
+        """
+        return self.accounts_balances(addresses), self.accounts_frontiers(addresses)
+
     def accounts_pending(self, accounts, threshold=None, source=False, count=1, include_active=False, sorting=True,
                          include_only_confirmed=True):
         """
@@ -391,27 +437,29 @@ class NodeInterface:
         :return:
             Snapshot object that can be exported to a file or loaded into a VirtualNode.
         """
-        def fetch_account(address):
-            account_info = self.account_info(nano_address=address, representative=True, weight=True, pending=True)
-            if account_info.get('error', None) == 'Account not found':
-                if missing == 'raise':
-                    raise KeyError(f"Account {address} not found in the ledger.")
-                else:
-                    account_info = None
-
-            return account_info
-
         if type(accounts_list) is str:
             accounts_list = [accounts_list]
 
+        # Repeated accounts are requested only once
+        accounts_list = list(dict.fromkeys(accounts_list))
+
         if blocks_list is None:
             blocks_list = []
 
         current_date = now(self._timezone)
 
         # 1. We retrieve every account
-        snapshot_accounts = {address: fetch_account(address) for address in accounts_list}
-        snapshot_accounts = {k: v for k, v in snapshot_accounts.items() if v is not None}
+        snapshot_accounts = {}
+
+        for address, account_info in self.accounts_info(accounts_list, representative=True, weight=True,
+                                                        pending=True).items():
+            if account_info.get('error', None) == 'Account not found':
+                if missing == 'raise':
+                    raise KeyError(f"Account {address} not found in the ledger.")
+
+                continue
+
+            snapshot_accounts[address] = account_info
 
         # 2. We retrieve pending blocks of every account
         snapshot_pending_blocks = self.accounts_pending(accounts_list, source=True, count=max_pending,
@@ -420,28 +468,35 @@ class NodeInterface:
 
         # 3. We retrieve history blocks of every account
         snapshot_history_blocks = {
-            address: self.account_history(nano_address=address, count=(1 if shallow_history else -1))['history']
-            for address in accounts_list
+            address: history['history']
+            for address, history in self.accounts_history(accounts_list, count=(1 if shallow_history else -1)).items()
         }
 
-        blocks_to_fetch = [list(blocks.keys()) for address, blocks in snapshot_pending_blocks.items()]
-        if len(blocks_to_fetch):
-            blocks_to_fetch = np.hstack(blocks_to_fetch)
+        # Hashes are deduplicated keeping the order in which they were found
+        blocks_to_fetch = dict.fromkeys(block_hash for blocks in snapshot_pending_blocks.values()
+                                        for block_hash in blocks)
+        blocks_to_fetch.update(dict.fromkeys(blocks_list))
+        blocks_to_fetch.update(dict.fromkeys(block['hash'] for history in snapshot_history_blocks.values()
+                                             for block in history))
 
         blocks_to_fetch = list(blocks_to_fetch)
-        blocks_to_fetch += blocks_list
 
-        for address, history in snapshot_history_blocks.items():
-            for block in history:
-                blocks_to_fetch.append(block['hash'])
+        # Blocks are requested in chunks, concurrently, to keep the size of each request and answer bounded
+        chunk_size = rcParams["rpc.blocks_info_chunk_size"]
+        chunks = [blocks_to_fetch[i:i + chunk_size] for i in range(0, len(blocks_to_fetch), chunk_size)]
+
+        with ThreadPoolExecutor(max_workers=rcParams["rpc.max_concurrency"]) as executor:
+            responses = list(executor.map(lambda chunk: self.blocks_info(chunk, include_not_found=True), chunks))
 
-        blocks_to_fetch = np.unique(blocks_to_fetch).tolist()
+        snapshot_blocks = {}
+        blocks_not_found = []
 
-        blocks_info = self.blocks_info(blocks_to_fetch, include_not_found=True)
-        snapshot_blocks = blocks_info['blocks']
+        for blocks_info in responses:
+            snapshot_blocks.update(blocks_info['blocks'])
+            blocks_not_found += blocks_info.get('blocks_not_found', [])
 
-        if len(blocks_info.get('blocks_not_found', [])) > 0 and missing == 'raise':
-            raise KeyError(f"The following blocks were not found in the ledger: {blocks_info['blocks_not_found']}")
+        if len(blocks_not_found) > 0 and missing == 'raise':
+            raise KeyError(f"The following blocks were not found in the ledger: {blocks_not_found}")
 
         snapshot_struct = {
             "snapshot_node_source": "virtual",
@@ -455,8 +510,35 @@ class NodeInterface:
 
         return NodeSnapshot(snapshot_struct)
 
+    async def asnapshot(self, accounts_list, blocks_list=None, shallow_history=True, max_pending=100,
+                        pending_threshold=None, missing='raise'):
+        """
+        Asynchronous version of `snapshot()`, for callers running inside an event loop.
+
+        The snapshot is built in a worker thread, so the event loop keeps serving other tasks (for example, more
+        snapshots gathered with `asyncio.gather()`) while the node answers.
+
+        Usage example:
+            >>> snapshot_a, snapshot_b = await asyncio.gather(node.asnapshot(accounts_a), node.asnapshot(accounts_b))
+
+        Or from synchronous code:
+            >>> snapshot = asyncio.run(node.asnapshot(accounts_list))
+
+        For the parameters, check `snapshot()`.
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(None, partial(self.snapshot, accounts_list, blocks_list, shallow_history,
+                                                        max_pending, pending_threshold, missing))
+
+    def clear_cache(self):
+        """
+        Discards the answers of the node cached in memory, so that further requests reach the node again.
+        """
+        clear_cache(self)
+
     @contextmanager
-    def tape_record(self):
+    def tape_record(self, journal=None):
         """
         Yields a tape record object that contains all the blocks' definition for the hooked `process()` method.
         This method is decorated with a context manager.
@@ -472,10 +554,19 @@ class NodeInterface:
             >>> print(rec)
             [TAPE_RECORD] 1 operations tracked.
         ```
+
+        :param journal:
+            Path of a file where every operation is also appended as soon as it is recorded (optional), so that the
+            recorded operations are not lost if the process crashes. Check `TapeRecord.from_journal()`.
         """
-        self._tape_record = TapeRecord()
-        yield self._tape_record
-        self._tape_record = None
+        self._tape_record = TapeRecord(journal=journal)
+
+        try:
+            yield self._tape_record
+
+        finally:
+            # Recording must stop even if the block of the context manager fails
+            self._tape_record = None
 
     def healthy(self):
         """
@@ -1,4 +1,12 @@
+import asyncio
+import random
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from nanoblocks import rcParams
 from nanoblocks.exceptions.node_limit_reached import NodeLimitReached
@@ -7,41 +15,255 @@ from nanoblocks.exceptions.node_unreachable import NodeUnreachable
 from nanoblocks.node.node_interface import NodeInterface, SYSTEM_TIMEZONE
 from nanoblocks.node.websocket.node_websocket import NodeWebsocket
 from nanoblocks.utils import cache
+from nanoblocks.utils.json import json_dumps, json_loads
+
+try:
+    # httpx (optional) allows multiplexing concurrent requests over a single HTTP/2 connection
+    import httpx
+except ImportError:
+    httpx = None
+
+# Messages without parameters never change, so they are serialized only once.
+_VERSION_MESSAGE = json_dumps({"action": "version"})
+_AVAILABLE_SUPPLY_MESSAGE = json_dumps({"action": "available_supply"})
+_PEERS_MESSAGE = json_dumps({"action": "peers"})
+_TELEMETRY_MESSAGE = json_dumps({"action": "telemetry"})
+_BLOCK_COUNT_MESSAGE = json_dumps({"action": "block_count"})
+
+# The active difficulty is usually polled at a high rate, so both of its variants are serialized only once as well.
+_ACTIVE_DIFFICULTY_MESSAGES = {
+    include_trend: json_dumps({"action": "active_difficulty", "include_trend": include_trend})
+    for include_trend in (False, True)
+}
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Actions that change the state of the node or the network. If one of them fails after reaching the node, the node may
+# have applied it anyway, and repeating it would fail (e.g. "Old block" or "Fork") or apply it twice. They are never
+# retried.
+_NON_IDEMPOTENT_ACTIONS = frozenset({"process", "send", "receive", "account_create", "accounts_create",
+                                     "wallet_create"})
+
+# Templates of the messages built on hot paths (one per account or block); only the variable fields are set per call.
+_ACCOUNT_INFO_TEMPLATE = {
+    "action": "account_info",
+    "representative": False,
+    "weight": False,
+    "pending": True,
+    "include_confirmed": False
+}
+
+_BLOCK_INFO_TEMPLATE = {
+    "action": "block_info",
+    "json_block": True
+}
+
+
+def _decode_response(status_code, content):
+    # Server errors (for example, from a proxy in front of the node) usually come without a JSON body
+    if status_code >= 500:
+        raise NodeUnreachable(f"Node answered with the HTTP error {status_code}.")
+
+    try:
+        return json_loads(content)
+
+    except ValueError:
+        raise NodeUnreachable(f"Node answered with an invalid JSON (HTTP status {status_code}).") from None
+
+
+def _check_limit(response):
+    # Detection of many requests issue on some public nodes
+    if type(response) is dict and response.get('message') == 'Too Many Requests':
+        raise NodeLimitReached("Reached maximum requests quota for this node. Wait a few minutes for it to be released or use another node (check nanoblocks.node for other public nodes or mount your own node to avoid this issue).")
+
+
+def _is_idempotent(message):
+    # Serialized messages are only prebuilt for read-only actions
+    return type(message) is not dict or message.get("action") not in _NON_IDEMPOTENT_ACTIONS
+
+
+def _chunk_message(message, items_key):
+    # Copies of the message holding up to rcParams['rpc.chunk_size'] of its items each
+    items = message[items_key]
+    chunk_size = rcParams['rpc.chunk_size']
+
+    if len(items) <= chunk_size:
+        return [message]
+
+    return [{**message, items_key: items[i:i + chunk_size]} for i in range(0, len(items), chunk_size)]
+
+
+def _merge_chunks(responses):
+    # Joins the answers of the chunks of a message as if the whole list of items had been requested at once
+    result = {}
+
+    for response in responses:
+        if 'error' in response:
+            return response
+
+        for key, value in response.items():
+            if type(value) is dict:
+                result.setdefault(key, {}).update(value)
+
+            elif type(value) is list:
+                result.setdefault(key, []).extend(value)
+
+            else:
+                result.setdefault(key, value)
+
+    return result
+
+
+def _close_connections(*connections):
+    for connection in connections:
+        if connection is not None:
+            connection.close()
+
+
+def _http2_client(pool_size):
+    return httpx.Client(http2=True, limits=httpx.Limits(max_connections=pool_size,
+                                                        max_keepalive_connections=pool_size))
+
+
+def _account_info_message(nano_address, representative, weight, pending, include_confirmed):
+    message = _ACCOUNT_INFO_TEMPLATE.copy()
+    message["account"] = nano_address
+
+    if representative:
+        message["representative"] = representative
+
+    if weight:
+        message["weight"] = weight
+
+    if not pending:
+        message["pending"] = pending
+
+    if include_confirmed:
+        message["include_confirmed"] = include_confirmed
+
+    return message
 
 
 class NodeRemote(NodeInterface):
 
     # Inheriting the docstrings from the interface
     __doc__ = NodeInterface.__doc__ + (__doc__ if __doc__ is not None else "")
+    __slots__ = ('_http_url', '_timeout', '_ws_url', '_ws_handler', '_batch_supported', '_session', '_client',
+                 '_inflight', '_inflight_lock', '_max_retries', '_pool_size', '_finalizer')
+
+    def __init__(self, http_url, ws_url=None, timezone=SYSTEM_TIMEZONE, timeout=None, pool_size=None,
+                 max_retries=None):
+        """
+        Constructor of the NodeRemote class.
+
+        :param http_url:
+            URL of the RPC API of the node.
+
+        :param ws_url:
+            URL of the websocket of the node (optional).
+
+        :param timezone:
+            Timezone to express the dates of the node.
 
-    def __init__(self, http_url, ws_url=None, timezone=SYSTEM_TIMEZONE):
+        :param timeout:
+            Number of seconds to wait for the node to answer a request. By default, rcParams['requests.timeout'].
+            Connecting to the node times out earlier, after rcParams['requests.connect_timeout'] seconds.
+
+        :param pool_size:
+            Maximum number of connections kept open with the node, to serve concurrent requests. It should be at least
+            the number of requests in flight at the same time (`max_workers` of `ask_many()`); further connections are
+            opened and discarded on every request. By default, the largest of rcParams['requests.pool_size'] and
+            rcParams['rpc.max_concurrency'].
+
+        :param max_retries:
+            Number of times a request is retried when the connection fails or the node answers with a server error. By
+            default, rcParams['requests.max_retries']. Actions that change the state of the network (like `process`)
+            are never retried.
+        """
         super().__init__(timezone=timezone)
         self._http_url = http_url
+        self._timeout = timeout
+        self._max_retries = rcParams['requests.max_retries'] if max_retries is None else max_retries
         self._ws_url = ws_url
         self._ws_handler = NodeWebsocket(ws_url)
+        self._batch_supported = None
+        self._inflight = {}
+        self._inflight_lock = Lock()
+
+        # A persistent session keeps the connections to the node alive between requests, avoiding a TCP+TLS handshake
+        # per RPC call. Retries are handled by _post(), not by the adapter: several RPC calls (like process) are not
+        # safe to be retried blindly.
+        if pool_size is None:
+            pool_size = max(rcParams['requests.pool_size'], rcParams['rpc.max_concurrency'])
+
+        self._pool_size = pool_size
+        self._session = None
+        self._client = None
+
+        if rcParams['requests.http2']:
+            if httpx is None:
+                raise ImportError("rcParams['requests.http2'] requires the httpx package: pip install httpx[http2]")
+
+            # Concurrent requests to the node share a single HTTP/2 connection instead of one connection each
+            self._client = _http2_client(pool_size)
+
+        else:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+        # The sockets are released when the node is garbage collected or, at the latest, when the interpreter exits.
+        self._finalizer = weakref.finalize(self, _close_connections, self._session, self._client)
 
     @property
     def http_url(self):
         return self._http_url
 
+    @property
+    def _cache_namespace(self):
+        # Identifies the answers of this node in the persistent cache
+        return self._http_url
+
     @property
     def ws_url(self):
         return self._ws_url
 
     @property
     def ws(self):
-        if not self._ws_handler.running and self._ws_handler.healthy():
-            self._ws_handler.start()
+        # The websocket is opened on first use and then kept alive, so that every further access (and every failover
+        # switch to this node) reuses the same connection. The websockets library keeps it alive with pings.
+        if not self._ws_handler.running and self._ws_url is not None:
+            try:
+                self._ws_handler.start()
+
+            except Exception:
+                # The handler stays stopped; its healthy() method reports the failure.
+                pass
 
         return self._ws_handler
 
+    def close(self):
+        """
+        Closes the connections kept open with the node, including the websocket.
+
+        The node can still be used afterwards; new connections will be opened on demand.
+        """
+        self._close_http()
+        self._ws_handler.stop()
+
+    def _close_http(self):
+        _close_connections(self._session, self._client)
+
     def __str__(self):
         base_str = f"[Node http={self.http_url}"
 
         if self._ws_url is not None:
             base_str += f"; ws={self.ws_url}"
 
-        vendor = self.version['node_vendor']
+        # Printing (or inspecting in a debugger) must not contact the node: only a version already known is shown.
+        found, version = type(self).version.fget.peek(self)
+        vendor = version.get('node_vendor', "unknown") if found and type(version) is dict else "unknown"
 
         base_str += f" ({vendor})]"
         return base_str
@@ -53,13 +275,233 @@ class NodeRemote(NodeInterface):
         """
         Makes a call to the rest api with the specified message and returns the result.
 
+        Identical requests made concurrently from several threads are sent only once: the callers arriving while the
+        request is in flight wait for it and share its answer.
+
+        :param message:
+            A crafted JSON message, or its already serialized bytes.
+        """
+        payload = message if type(message) is bytes else json_dumps(message)
+
+        with self._inflight_lock:
+            future = self._inflight.get(payload)
+            in_flight = future is not None
+
+            if not in_flight:
+                future = Future()
+                self._inflight[payload] = future
+
+        if in_flight:
+            return future.result()
+
+        try:
+            response = self._post(payload, retry=_is_idempotent(message))
+
+            _check_limit(response)
+
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+
+        finally:
+            with self._inflight_lock:
+                del self._inflight[payload]
+
+        future.set_result(response)
+        return response
+
+    def _ask_batch(self, messages):
+        """
+        Makes a single call to the rest api with a list of messages and returns the list of results, in order.
+
+        Not every node accepts JSON arrays as requests. The first batch sent to the node tells whether it does; if it
+        doesn't (it answers something else than a list, a server error, or it drops the connection), this and further
+        batches are sent as concurrent single requests with `ask_many()`. Once learned, the support is not changed by
+        later answers: a batch answered with something else than a list is sent with `ask_many()` that time only.
+
+        :param messages:
+            List of crafted JSON messages.
+        """
+        if self._batch_supported is not False:
+            idempotent = all(_is_idempotent(message) for message in messages)
+            probing = self._batch_supported is None
+
+            try:
+                # A node rejecting arrays rejects them every time, so the first batch is not retried
+                response = self._post(messages, retry=idempotent and not probing)
+
+            except (NodeUnreachable, NodeTimedOut):
+                # Messages not safe to repeat may have been applied already, so they are not sent again one by one
+                if not probing or not idempotent:
+                    raise
+
+                response = None
+
+            _check_limit(response)
+            supported = type(response) is list and len(response) == len(messages)
+
+            if probing:
+                self._batch_supported = supported
+
+            if supported:
+                return response
+
+        return self.ask_many(messages)
+
+    def ask_many(self, messages, max_workers=None):
+        """
+        Makes a call to the rest api for each of the messages, concurrently, and returns the list of results in order.
+
+        Each request is independent (unlike `_ask_batch()`, no JSON array is sent), so it works with any node. The
+        requests share the connection pool of the node.
+
+        Usage example:
+            >>> version, telemetry = node.ask_many([{"action": "version"}, {"action": "telemetry"}])
+
+        :param messages:
+            List of crafted JSON messages.
+
+        :param max_workers:
+            Maximum number of requests in flight at the same time. By default, rcParams["rpc.max_concurrency"].
+        """
+        messages = list(messages)
+
+        if len(messages) <= 1:
+            return [self._ask(message) for message in messages]
+
+        if max_workers is None:
+            max_workers = rcParams["rpc.max_concurrency"]
+
+        # The requests wait on the network, so their round trips overlap while running in threads.
+        with ThreadPoolExecutor(max_workers=min(len(messages), max_workers)) as executor:
+            return list(executor.map(self._ask, messages))
+
+    async def aask_many(self, messages, max_workers=None):
+        """
+        Asynchronous version of `ask_many()`, for callers running inside an event loop.
+
+        Each request runs in a worker thread, so the event loop keeps serving other tasks while the node answers. The
+        number of requests in flight is capped by `max_workers`.
+
+        Usage example:
+            >>> responses = await node.aask_many([{"action": "block_info", "hash": h} for h in hashes])
+
+        :param messages:
+            List of crafted JSON messages.
+
+        :param max_workers:
+            Maximum number of requests in flight at the same time. By default, rcParams["rpc.max_concurrency"].
+        """
+        if max_workers is None:
+            max_workers = rcParams["rpc.max_concurrency"]
+
+        semaphore = asyncio.Semaphore(max_workers)
+        loop = asyncio.get_running_loop()
+
+        async def ask(message):
+            async with semaphore:
+                return await loop.run_in_executor(None, self._ask, message)
+
+        return list(await asyncio.gather(*(ask(message) for message in messages)))
+
+    def _ask_chunked(self, message, items_key):
+        """
+        Makes a call to the rest api with a message holding a list of items (accounts, hashes...), splitting the list
+        in chunks of rcParams['rpc.chunk_size'] items so that requests and answers keep a bounded size.
+
+        Each chunk is sent in its own request, concurrently with `ask_many()`, and their answers are merged into a
+        single one as if the whole list had been requested at once: dictionaries (like "balances" or "blocks") are
+        joined and lists (like "blocks_not_found") are concatenated. If any chunk fails, its error answer is returned.
+
         :param message:
             A crafted JSON message.
+
+        :param items_key:
+            Key of the message that holds the list of items.
+        """
+        chunks = _chunk_message(message, items_key)
+
+        if len(chunks) == 1:
+            return self._ask(message)
+
+        return _merge_chunks(self.ask_many(chunks))
+
+    def _ask_batches(self, batches):
+        """
+        Makes a call to the rest api with each of the lists of messages through `_ask_batch()`, concurrently, and
+        returns the list of results of each batch, in order.
+
+        :param batches:
+            List of lists of crafted JSON messages.
+        """
+        if len(batches) <= 1:
+            return [self._ask_batch(messages) for messages in batches]
+
+        with ThreadPoolExecutor(max_workers=min(len(batches), rcParams["rpc.max_concurrency"])) as executor:
+            return list(executor.map(self._ask_batch, batches))
+
+    def _ask_batch_chunked(self, messages):
+        """
+        Makes a call to the rest api with a list of messages, sending at most rcParams['rpc.chunk_size'] messages per
+        request, and returns the list of results in order.
+
+        :param messages:
+            List of crafted JSON messages.
+        """
+        chunk_size = rcParams['rpc.chunk_size']
+        batches = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+
+        return [response for responses in self._ask_batches(batches) for response in responses]
+
+    def _post(self, payload, retry=True):
+        """
+        Posts the payload to the node and returns the decoded JSON answer.
+
+        Transient failures (the connection can't be established, or the node answers with a server error) are retried
+        up to `max_retries` times, waiting a random time between 0 and an exponentially growing limit (starting at
+        rcParams['requests.backoff_seconds'], up to rcParams['requests.max_backoff_seconds']). The randomness keeps
+        many clients from retrying against the node at the same time. Timeouts are not retried.
+
+        :param payload:
+            A crafted JSON message, a list of them, or the already serialized bytes.
+
+        :param retry:
+            Whether transient failures are retried. False for actions that are not safe to repeat (like `process`).
         """
-        timeout_seconds = rcParams['requests.timeout']
+        if type(payload) is not bytes:
+            payload = json_dumps(payload)
+
+        attempt = 0
+
+        while True:
+            try:
+                return self._post_once(payload)
+
+            except NodeUnreachable:
+                if not retry or attempt >= self._max_retries:
+                    raise
+
+            backoff_limit = min(rcParams['requests.backoff_seconds'] * 2 ** attempt,
+                                rcParams['requests.max_backoff_seconds'])
+            time.sleep(random.uniform(0, backoff_limit))
+            attempt += 1
+
+    def _post_once(self, payload):
+        """
+        Posts the serialized payload to the node once and returns the decoded JSON answer.
+
+        :param payload:
+            Serialized JSON message.
+        """
+        # Connect and read timeouts. Without them a half-open connection would hang forever instead of failing over.
+        timeout_seconds = self._timeout or rcParams['requests.timeout']
+        timeout = (min(rcParams['requests.connect_timeout'], timeout_seconds), timeout_seconds)
+
+        if self._client is not None:
+            return self._post_http2(payload, timeout)
 
         try:
-            response = requests.post(self.http_url, json=message, timeout=timeout_seconds).json()
+            response = self._session.post(self.http_url, data=payload, headers=_JSON_HEADERS, timeout=timeout)
 
         except requests.Timeout:
             raise NodeTimedOut(f"Node didn't answer for {timeout_seconds} seconds. Timed out.") from None
@@ -67,55 +509,75 @@ class NodeRemote(NodeInterface):
         except requests.ConnectionError:
             raise NodeUnreachable(f"Couldn't connect to node. Is it online?") from None
 
-        # Detection of many requests issue on some public nodes
-        if response.get('message') == 'Too Many Requests':
-            raise NodeLimitReached("Reached maximum requests quota for this node. Wait a few minutes for it to be released or use another node (check nanoblocks.node for other public nodes or mount your own node to avoid this issue).")
+        return _decode_response(response.status_code, response.content)
 
-        return response
+    def _post_http2(self, payload, timeout):
+        """
+        Posts the serialized payload to the node through the httpx client and returns the decoded JSON answer.
+
+        :param payload:
+            Serialized JSON message.
+
+        :param timeout:
+            Tuple (connect timeout, read timeout) in seconds.
+        """
+        connect_timeout, timeout_seconds = timeout
+        client = self._client
+
+        # Unlike a requests session, an httpx client can't be used once closed (see close()): a new one is opened.
+        if client.is_closed:
+            with self._inflight_lock:
+                client = self._client
+
+                if client.is_closed:
+                    client = self._client = _http2_client(self._pool_size)
+
+                    # The finalizer of the closed client is replaced, so that they don't pile up on every reopening
+                    self._finalizer.detach()
+                    self._finalizer = weakref.finalize(self, _close_connections, self._session, client)
+
+        try:
+            response = client.post(self.http_url, content=payload, headers=_JSON_HEADERS,
+                                   timeout=httpx.Timeout(timeout_seconds, connect=connect_timeout))
+
+        except httpx.TimeoutException:
+            raise NodeTimedOut(f"Node didn't answer for {timeout_seconds} seconds. Timed out.") from None
+
+        except httpx.TransportError:
+            raise NodeUnreachable(f"Couldn't connect to node. Is it online?") from None
+
+        return _decode_response(response.status_code, response.content)
 
     @property
-    @cache(seconds=100, cache_parameters=False)  # We cache some queries for a few seconds so that node spam is avoided.
+    @cache(seconds=3600, cache_parameters=False, persist=True, persist_seconds=86400)  # We cache some queries for a few seconds so that node spam is avoided.
     def version(self):
-        message = {
-            "action": "version"
-        }
+        return self._ask(_VERSION_MESSAGE)
 
-        return self._ask(message)
-
-    @cache(seconds=100, cache_parameters=False)
+    @cache(seconds=600, cache_parameters=False, persist=True)
     def available_supply(self):
-        message = {
-            "action": "available_supply"
-        }
-
-        return self._ask(message)
+        return self._ask(_AVAILABLE_SUPPLY_MESSAGE)
 
-    @cache(seconds=100, cache_parameters=True)
+    @cache(seconds=1, cache_parameters=True)
     def active_difficulty(self, include_trend=False):
-        message = {
-            "action": "active_difficulty",
-            "include_trend": include_trend
-        }
+        message = _ACTIVE_DIFFICULTY_MESSAGES.get(include_trend)
+
+        if message is None:
+            message = {
+                "action": "active_difficulty",
+                "include_trend": include_trend
+            }
 
         return self._ask(message)
 
     @cache(seconds=100, cache_parameters=False)
     def peers(self):
-        message = {
-            "action": "peers"
-        }
-
-        return self._ask(message)
+        return self._ask(_PEERS_MESSAGE)
 
     @cache(seconds=4, cache_parameters=False)
     def telemetry(self):
-        message = {
-            "action": "telemetry"
-        }
+        return self._ask(_TELEMETRY_MESSAGE)
 
-        return self._ask(message)
-
-    @cache(seconds=30, cache_parameters=True)
+    @cache(seconds=30, cache_parameters=True, persist=True)
     def representatives(self, count=None, sorting=False):
         message = {
             "action": "representatives",
@@ -141,16 +603,7 @@ class NodeRemote(NodeInterface):
 
     @cache(seconds=1, cache_parameters=True)
     def account_info(self, nano_address, representative=False, weight=False, pending=True, include_confirmed=False):
-        message = {
-            "action": "account_info",
-            "representative": representative,
-            "account": nano_address,
-            "weight": weight,
-            "pending": pending,
-            "include_confirmed": include_confirmed
-        }
-
-        return self._ask(message)
+        return self._ask(_account_info_message(nano_address, representative, weight, pending, include_confirmed))
 
     @cache(seconds=1, cache_parameters=True)
     def account_history(self, nano_address, raw=False, count=10, previous=None, head=None, reverse=None, offset=None,
@@ -164,8 +617,8 @@ class NodeRemote(NodeInterface):
         if raw:
             message['raw'] = raw
 
-        if previous:
-            message['head'] = previous
+        # `previous` is an alias of `head`; `head` takes precedence when both are given
+        head = head or previous
 
         if head:
             message['head'] = head
@@ -188,7 +641,7 @@ class NodeRemote(NodeInterface):
             "accounts": addresses
         }
 
-        return self._ask(message)
+        return self._ask_chunked(message, "accounts")
 
     @cache(seconds=1, cache_parameters=True)
     def accounts_frontiers(self, addresses):
@@ -197,7 +650,47 @@ class NodeRemote(NodeInterface):
             "accounts": addresses
         }
 
-        return self._ask(message)
+        return self._ask_chunked(message, "accounts")
+
+    def accounts_info(self, addresses, representative=False, weight=False, pending=True, include_confirmed=False):
+        addresses = list(addresses)
+
+        responses = self._ask_batch_chunked([
+            _account_info_message(address, representative, weight, pending, include_confirmed)
+            for address in addresses
+        ])
+
+        return dict(zip(addresses, responses))
+
+    def accounts_history(self, addresses, count=10):
+        addresses = list(addresses)
+
+        responses = self._ask_batch_chunked([
+            {
+                "action": "account_history",
+                "account": address,
+                "count": count
+            }
+            for address in addresses
+        ])
+
+        return dict(zip(addresses, responses))
+
+    @cache(seconds=1, cache_parameters=True)
+    def accounts_balances_frontiers(self, addresses):
+        balances_chunks = _chunk_message({"action": "accounts_balances", "accounts": addresses}, "accounts")
+        frontiers_chunks = _chunk_message({"action": "accounts_frontiers", "accounts": addresses}, "accounts")
+
+        # Balances and frontiers of each chunk of accounts travel together in a single round trip
+        responses = self._ask_batches([list(pair) for pair in zip(balances_chunks, frontiers_chunks)])
+
+        if len(responses) == 1:
+            return tuple(responses[0])
+
+        balances = _merge_chunks(balances for balances, _ in responses)
+        frontiers = _merge_chunks(frontiers for _, frontiers in responses)
+
+        return balances, frontiers
 
     @cache(seconds=1, cache_parameters=True)
     def accounts_pending(self, accounts, threshold=None, source=False, count=1, include_active=False, sorting=True,
@@ -216,23 +709,19 @@ class NodeRemote(NodeInterface):
         if threshold is not None:
             message['threshold'] = threshold
 
-        return self._ask(message)
+        return self._ask_chunked(message, "accounts")
 
-    @cache(seconds=1, cache_parameters=True)
+    @cache(seconds=2, cache_parameters=True)
     def block_count(self, include_cemented=True):
-        message = {
-            "action": "block_count"
-        }
-
-        return self._ask(message)
+        return self._ask(_BLOCK_COUNT_MESSAGE)
 
     @cache(seconds=1, cache_parameters=True)
     def block_info(self, block_hash, json_block=True):
-        message = {
-            "action": "block_info",
-            "json_block": json_block,
-            "hash": block_hash
-        }
+        message = _BLOCK_INFO_TEMPLATE.copy()
+        message["hash"] = block_hash
+
+        if not json_block:
+            message["json_block"] = json_block
 
         return self._ask(message)
 
@@ -248,7 +737,7 @@ class NodeRemote(NodeInterface):
             "hashes": blocks_hashes
         }
 
-        return self._ask(message)
+        return self._ask_chunked(message, "hashes")
 
     def block_confirm(self, block_hash):
         message = {
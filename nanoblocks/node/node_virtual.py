@@ -1,10 +1,13 @@
 from nanoblocks.node.node_interface import NodeInterface, SYSTEM_TIMEZONE
+from nanoblocks.node.snapshot import NodeSnapshot
 
 
 class NodeVirtual(NodeInterface):
 
     # Inheriting the docstrings from the interface
     __doc__ = NodeInterface.__doc__ + (__doc__ if __doc__ is not None else "")
+    __slots__ = ('_internal_accounts', '_internal_accounts_history', '_internal_accounts_pending', '_internal_blocks',
+                 '_last_snapshot')
 
     def __init__(self, timezone=SYSTEM_TIMEZONE, internal_accounts=None, internal_accounts_history=None,
                  internal_accounts_pending=None, internal_blocks=None):
@@ -91,13 +94,15 @@ class NodeVirtual(NodeInterface):
         return result
 
     def telemetry(self):
+        block_count = str(len(self._internal_blocks))
+
         result = {
-            'block_count': len(self._internal_blocks),
-            'cemented_count': len(self._internal_blocks),
-            'unchecked_count': 0,
-            'account_count': len(self._internal_accounts),
-            'bandwidth_cap': 0,
-            'peer_count': 0,
+            'block_count': block_count,
+            'cemented_count': block_count,
+            'unchecked_count': '0',
+            'account_count': str(len(self._internal_accounts)),
+            'bandwidth_cap': '0',
+            'peer_count': '0',
             'protocol_version': '18',
             'uptime': '0',
             'genesis_block': '991CF190094C00F0B68E2E5F75F6BEE95A2E0BD93CEAA4A6734DB9F19B728948',
@@ -110,8 +115,6 @@ class NodeVirtual(NodeInterface):
             'active_difficulty': 'fffffff800000000'
         }
 
-        result = {k: str(v) for k, v in result.items()}
-
         return result
 
     def representatives(self, count=10, sorting=False):
@@ -148,14 +151,19 @@ class NodeVirtual(NodeInterface):
         return result
 
     def accounts_balances(self, addresses):
-        result = {
-            'balances': {
-                address: {
-                    'balance': self._internal_accounts[address]['balance'] if address in self._internal_accounts else 0,
-                    'pending': self._internal_accounts[address]['pending'] if address in self._internal_accounts else 0,
-                }
-                for address in addresses
+        internal_accounts = self._internal_accounts
+        balances = {}
+
+        for address in addresses:
+            account_info = internal_accounts.get(address)
+
+            balances[address] = {
+                'balance': account_info['balance'] if account_info is not None else 0,
+                'pending': account_info['pending'] if account_info is not None else 0,
             }
+
+        result = {
+            'balances': balances
         }
 
         return result
@@ -171,20 +179,32 @@ class NodeVirtual(NodeInterface):
 
     def accounts_pending(self, accounts, threshold=None, source=False, count=1, include_active=False, sorting=True,
                          include_only_confirmed=True):
-        result = {
-            'blocks': {
-                address: {self._internal_accounts_pending[address]: self._internal_blocks[self._internal_accounts_pending[address]]['balance']}
-                for address in accounts
-            }
+        internal_accounts_pending = self._internal_accounts_pending
+        internal_blocks = self._internal_blocks
+        pending_blocks = {}
+
+        for address in accounts:
+            pending = internal_accounts_pending.get(address)
+
+            # Snapshots store the {block_hash: amount} answer of the node; otherwise a single block hash is stored
+            if type(pending) is str and pending != '':
+                pending = {pending: internal_blocks[pending]['balance']}
+
+            # Accounts without pending blocks are answered with an empty string, as the node does
+            pending_blocks[address] = pending or ''
 
+        result = {
+            'blocks': pending_blocks
         }
         return result
 
     def block_count(self, include_cemented=True):
+        block_count = str(len(self._internal_blocks))
+
         result = {
-            'count': str(len(self._internal_blocks)),
+            'count': block_count,
             'unchecked': '0',
-            'cemented': str(len(self._internal_blocks))
+            'cemented': block_count
         }
         return result
 
@@ -193,19 +213,16 @@ class NodeVirtual(NodeInterface):
         return result
 
     def blocks_info(self, blocks_hashes, json_block=True, include_not_found=False):
-        blocks = {}
-        no_blocks = []
+        internal_blocks = self._internal_blocks
 
-        for block_hash in blocks_hashes:
-            block_info = self.block_info(block_hash)
-
-            if 'error' not in block_info:
-                blocks[block_hash] = block_info
-            else:
-                no_blocks.append(block_hash)
+        blocks = {block_hash: internal_blocks[block_hash] for block_hash in blocks_hashes
+                  if block_hash in internal_blocks}
+        no_blocks = [block_hash for block_hash in blocks_hashes if block_hash not in internal_blocks]
 
         if include_not_found:
             result = {'blocks': blocks, 'blocks_not_found': no_blocks}
+        elif len(no_blocks) == 0:
+            result = {'blocks': blocks}
         else:
             result = {'error': 'Block not found'}
 
@@ -227,8 +244,12 @@ class NodeVirtual(NodeInterface):
         Incremental updates are supported by default, meaning that the internal state of this virtual node can be
         updated with sequential loads of snapshots.
 
-        :param snapshot: snapshot of accounts, blocks and transactions history from a real node.
+        :param snapshot: snapshot of accounts, blocks and transactions history from a real node, or the path of a
+            file where a snapshot was dumped.
         """
+        if not isinstance(snapshot, NodeSnapshot):
+            snapshot = NodeSnapshot.from_file(snapshot)
+
         self._internal_accounts.update(snapshot.accounts)
         self._internal_blocks.update(snapshot.blocks)
         self._internal_accounts_pending.update(snapshot.pending_blocks)
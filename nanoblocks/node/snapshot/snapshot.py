@@ -1,4 +1,6 @@
-import joblib
+from datetime import datetime
+
+from nanoblocks.utils import serialization
 
 
 class NodeSnapshot:
@@ -9,6 +11,8 @@ class NodeSnapshot:
     offline transactions, which can be recorded back and serialized afterwards to be published in the future in an
     online environment.
     """
+    __slots__ = ('_snapshot_struct',)
+
     def __init__(self, snapshot_struct):
         self._snapshot_struct = snapshot_struct
 
@@ -47,10 +51,28 @@ class NodeSnapshot:
         return self.__repr__()
 
     def to_file(self, file):
-        joblib.dump(self._snapshot_struct, file, compress=("lz4", 1))
+        """
+        Dumps the snapshot into a file. Check `nanoblocks.utils.serialization.dump()` for the format.
+
+        :param file:
+            Path of the file to write, or a file object opened in binary mode.
+        """
+        snapshot_struct = dict(self._snapshot_struct)
+        snapshot_struct['snapshot_date'] = self.timestamp.isoformat()
+        serialization.dump(snapshot_struct, file)
 
     @classmethod
     def from_file(cls, file):
-        snapshot_struct = joblib.load(file)
+        """
+        Loads a snapshot from a file, written either by `to_file()` or by previous versions of nanoblocks.
+
+        :param file:
+            Path of the file to read, or a file object opened in binary mode.
+        """
+        snapshot_struct = serialization.load(file)
+
+        if type(snapshot_struct['snapshot_date']) is str:
+            snapshot_struct['snapshot_date'] = datetime.fromisoformat(snapshot_struct['snapshot_date'])
+
         instance = cls(snapshot_struct)
         return instance
@@ -1,4 +1,5 @@
-import joblib
+from nanoblocks.utils import serialization
+from nanoblocks.utils.json import json_dumps, json_loads
 
 
 class TapeRecord(list):
@@ -7,7 +8,33 @@ class TapeRecord(list):
 
     This tape record can be inputted into any `node.process()` call method and all its operations will be broadcast
     into the specified node.
+
+    Optionally, every operation can also be appended to a journal file as soon as it is recorded (one JSON line per
+    operation), so that the recorded operations survive a crash without dumping the whole tape on every operation.
     """
+    __slots__ = ('_journal',)
+
+    def __init__(self, operations=(), journal=None):
+        """
+        Constructor of the class
+
+        :param operations:
+            Operations already recorded.
+
+        :param journal:
+            Path of a file where every further operation is appended as soon as it is recorded (optional). It can be
+            loaded back with `from_journal()`.
+        """
+        super().__init__(operations)
+        self._journal = journal
+
+    def append(self, operation):
+        super().append(operation)
+
+        if self._journal is not None:
+            with open(self._journal, "ab") as f:
+                f.write(json_dumps(operation) + b"\n")
+
     def __repr__(self):
         return f"[TAPE_RECORD] {len(self)} operations tracked."
 
@@ -15,8 +42,31 @@ class TapeRecord(list):
         return self.__repr__()
 
     def to_file(self, file):
-        joblib.dump(self, file, compress=("lz4", 1))
+        """
+        Dumps the tape record into a file. Check `nanoblocks.utils.serialization.dump()` for the format.
+
+        :param file:
+            Path of the file to write, or a file object opened in binary mode.
+        """
+        serialization.dump(list(self), file)
 
-    @staticmethod
+    @classmethod
     def from_file(cls, file):
-        return joblib.load(file)
+        """
+        Loads a tape record from a file, written either by `to_file()` or by previous versions of nanoblocks.
+
+        :param file:
+            Path of the file to read, or a file object opened in binary mode.
+        """
+        return cls(serialization.load(file))
+
+    @classmethod
+    def from_journal(cls, journal):
+        """
+        Loads a tape record from a journal file, where the operations were appended as they were recorded.
+
+        :param journal:
+            Path of the journal file.
+        """
+        with open(journal, "rb") as f:
+            return cls(json_loads(line) for line in f if line.strip())
@@ -1,17 +1,47 @@
 import atexit
-import json
 import asyncio
+import queue
 import socket
 import threading
-import numpy as np
+import warnings
+from concurrent.futures import wait
 from threading import Thread, Lock, Event
 
 import websockets
 
+try:
+    # uvloop (optional) runs the websockets loop with a faster event loop implementation
+    import uvloop
+
+except ImportError:
+    uvloop = None
+
+from nanoblocks import rcParams
 from nanoblocks.node.websocket.tracking.tracking import Tracking
+from nanoblocks.utils.json import json_dumps, json_loads
 
 # TODO: Allow "update" on subscriptions. When they update the proxies.
 
+_event_loop = None
+_event_loop_lock = Lock()
+
+
+def _ensure_loop():
+    """
+    Retrieves the event loop where every websocket connection is handled, starting it on first use.
+
+    A single background thread runs this loop for all the NodeWebsocket instances. Connections wait for messages or
+    actions without polling, so an idle loop does not wake up at all.
+    """
+    global _event_loop
+
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            Thread(target=_event_loop.run_forever, name="nanoblocks-websockets", daemon=True).start()
+
+    return _event_loop
+
 
 class NodeWebsocket:
     """
@@ -27,17 +57,24 @@ class NodeWebsocket:
         """
         self._ws_url = ws_url
         self._lock = Lock()
-        self._callback_event = Event()
         self._connection_success_event = Event()
 
-        self._thread = None
+        self._future = None
         self._terminate = False
         self._topic = topic
+
+        # Actions without accounts never change, so they are serialized once
+        self._subscribe_payload = json_dumps({"action": "subscribe", "topic": topic}).decode()
+        self._unsubscribe_payload = json_dumps({"action": "unsubscribe", "topic": topic}).decode()
+
+        # Actions queued while the connection is not established yet. Afterwards, they are put in the asyncio queue.
         self._actions_list = []
+        self._actions_queue = None
         self._callbacks = {}
+        self._queues = {}
         self._error = None
 
-        # Since websockets are wrapped in a thread, this is required to safely release resources when application
+        # Since websockets are handled in a background loop, this is required to safely release resources when application
         # is closed.
         atexit.register(self.stop)
 
@@ -49,10 +86,10 @@ class NodeWebsocket:
             Accounts being watched by this instance.
         """
 
-        with self._lock:
-            accounts_list = [[acc for acc in accounts if acc != "all"] for c, accounts in self._callbacks.items()]
+        accounts = {acc for callback_accounts in self._callbacks.values() for acc in callback_accounts}
 
-        return [acc for acc in np.unique(np.hstack(accounts_list))] if len(accounts_list) > 0 else []
+        accounts.discard("all")
+        return sorted(accounts)
 
     @property
     def callbacks(self):
@@ -62,113 +99,190 @@ class NodeWebsocket:
     def running(self):
         """
         :return:
-            Retrieves whether the thread is running or not.
+            Retrieves whether the connection handler is running or not.
         """
-        return self._thread is not None and self._thread.is_alive()
+        return self._future is not None and not self._future.done()
+
+    async def _connect(self):
+        compression = "deflate" if rcParams["websocket.compression"] else None
+        return await websockets.connect(self._ws_url, compression=compression)
 
-    def _thread_loop(self):
+    async def _handler(self):
         """
-        Body of the thread function.
+        Handles the websocket connection: sends the queued actions while the received messages are dispatched.
+
+        Messages are received by a single task (check `_receive()`), so that no task has to be created per message;
+        the handler only wakes up to send an action, and finishes when a None action is queued. If the connection is
+        closed by the node, it is opened again (check `_reconnect()`).
         """
-        async def _handler():
-            try:
-                connection = await websockets.connect(self._ws_url)
-            except Exception as e:
-                connection = None
-                with self._lock:
-                    self._error = e
+        try:
+            connection = await self._connect()
+
+        except Exception as e:
+            with self._lock:
+                self._error = e
 
             self._connection_success_event.set()
-            self._connection_success_event.clear()
+            return
 
-            if self._error is not None:
-                return
+        with self._lock:
+            self._actions_queue = asyncio.Queue()
 
-            while not self._terminate or len(self._actions_list) > 0:
-                # We pick actions and execute them
-                #if actions is None or len(actions) == 0:
-                #    actions = self._actions
+            for action in self._actions_list:
+                self._actions_queue.put_nowait(action)
 
-                #if len(actions) > 0:
-                #    action = actions.pop(0)
-                for action in self._actions:
-                    print(action)
-                    await connection.send(json.dumps(action))
+            self._actions_list.clear()
 
-                try:
-                    message = json.loads(await asyncio.wait_for(connection.recv(), 0.5))
-                    print(message)
-                except asyncio.futures.TimeoutError:
+        self._connection_success_event.set()
+
+        receive_task = asyncio.ensure_future(self._receive(connection))
+        action_task = asyncio.ensure_future(self._actions_queue.get())
+
+        try:
+            while True:
+                done, _ = await asyncio.wait({receive_task, action_task}, return_when=asyncio.FIRST_COMPLETED)
+
+                # The connection was closed by the node (other errors are raised from here)
+                if receive_task in done:
+                    try:
+                        receive_task.result()
+
+                    except websockets.exceptions.ConnectionClosed:
+                        pass
+
+                    await connection.close()
+                    connection, action_task = await self._reconnect(action_task)
+
+                    if connection is None:
+                        break
+
+                    receive_task = asyncio.ensure_future(self._receive(connection))
                     continue
 
-                # A message was received. We store it in the queue if needed.
-                self._queue_message(message)
+                # Every action queued so far is sent at once, in order; a None action finishes the handler
+                actions = [action_task.result()]
 
-                self._callback_event.set()
-                self._callback_event.clear()
+                while not self._actions_queue.empty():
+                    actions.append(self._actions_queue.get_nowait())
 
-            await connection.close()
+                finish = None in actions
 
-        event_loop = asyncio.new_event_loop()
-        event_loop.run_until_complete(_handler())
-        event_loop.close()
+                if finish:
+                    actions = actions[:actions.index(None)]
 
-        with self._lock:
-            self._thread = None
+                try:
+                    for action in actions:
+                        await connection.send(action)
 
-    def track_confirmations(self, accounts_list, callback):
-        return Tracking(self, accounts_list, callback)
+                except websockets.exceptions.ConnectionClosed:
+                    # The receive task finishes as well; the subscriptions are restored once reconnected
+                    pass
 
-    @property
-    def _finish(self):
-        return self._terminate
+                if finish:
+                    break
 
-    @_finish.setter
-    def _finish(self, value):
-        with self._lock:
-            self._terminate = value
+                action_task = asyncio.ensure_future(self._actions_queue.get())
 
-    @property
-    def _actions(self):
-        with self._lock:
-            actions = list(self._actions_list)
-            self._actions_list.clear()
+        finally:
+            receive_task.cancel()
+            action_task.cancel()
+
+            with self._lock:
+                self._actions_queue = None
+
+            # Trackings waiting for messages are woken up to notice the disconnection
+            for messages_queue in self._queues.values():
+                messages_queue.put(None)
 
-        return actions
+            await connection.close()
 
-    def _pop_messages(self, callback, accounts_list):
+    async def _reconnect(self, action_task):
         """
-        Pops the stored messages from the given accounts.
-        Note that popping messages implies cleaning the queue for the given accounts.
+        Opens the connection again after the node closed it, and restores the subscriptions of the tracked accounts.
 
-        :param callback:
-            callback to retrieve messages from.
+        Attempts are spaced by a wait that doubles after every failed attempt (from
+        rcParams["websocket.reconnect_backoff_seconds"] up to rcParams["websocket.max_reconnect_backoff_seconds"]).
+        Actions queued meanwhile are discarded, since the subscriptions are restored from the tracked accounts, but a
+        None action stops the attempts.
 
-        :param accounts_list:
-            List of account whose messages should be retrieved.
+        :param action_task:
+            Task waiting for the next queued action.
 
         :return:
-            Messages list popped from the buffer
+            Tuple (connection, action_task). The connection is None if the handler must finish.
         """
-        with self._lock:
-            callback_key = self._get_callback_key(callback)
-            messages = []
+        backoff_seconds = rcParams["websocket.reconnect_backoff_seconds"]
 
-            for account in accounts_list:
-                callback_accounts = self._callbacks.get(callback_key, {})
-                messages += callback_accounts.get(account, [])
-                callback_accounts[account] = []
+        while True:
+            done, _ = await asyncio.wait({action_task}, timeout=backoff_seconds)
 
-            if len(accounts_list) == 0:
-                callback_accounts = self._callbacks.get(callback_key, {})
-                messages += callback_accounts.get("all", [])
-                callback_accounts["all"] = []
+            if action_task in done:
+                if action_task.result() is None:
+                    return None, action_task
+
+                action_task = asyncio.ensure_future(self._actions_queue.get())
+                continue
+
+            try:
+                connection = await self._connect()
+                break
+
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException):
+                backoff_seconds = min(backoff_seconds * 2, rcParams["websocket.max_reconnect_backoff_seconds"])
+
+        if any("all" in accounts for accounts in self._callbacks.values()):
+            self._subscribe([])
 
-        return messages
+        elif len(self.accounts_tracked) > 0:
+            self._subscribe(self.accounts_tracked)
+
+        return connection, action_task
+
+    async def _receive(self, connection):
+        """
+        Dispatches the messages received through the websocket, in arrival order, until the connection is closed.
+
+        Messages already buffered by the connection are consumed one after another without suspending the loop. Error
+        messages of the node (for example, to an invalid subscription) are warned about; they don't close the
+        connection, so the messages keep being received.
+
+        :param connection:
+            Websocket connection to receive the messages from.
+        """
+        async for raw_message in connection:
+            message = json_loads(raw_message)
+
+            # A message was received. We store it in the queue of every callback interested in it.
+            try:
+                self._queue_message(message)
+
+            except ConnectionError as e:
+                warnings.warn(f"The websocket of the node answered with an error: {e}")
+
+    def track_confirmations(self, accounts_list, callback):
+        return Tracking(self, accounts_list, callback)
+
+    @property
+    def _finish(self):
+        return self._terminate
+
+    @_finish.setter
+    def _finish(self, value):
+        with self._lock:
+            self._terminate = value
 
     def _queue_action(self, action):
+        """
+        Queues an action to be sent through the websocket.
+
+        :param action:
+            Action already serialized as a JSON string, or None to finish the connection handler.
+        """
         with self._lock:
-            self._actions_list.append(action)
+            if self._actions_queue is None:
+                self._actions_list.append(action)
+            else:
+                _ensure_loop().call_soon_threadsafe(self._actions_queue.put_nowait, action)
 
     def _queue_message(self, message):
         """
@@ -193,28 +307,32 @@ class NodeWebsocket:
         if account is None:
             return
 
-        with self._lock:
-            # Then, we add this message to the corresponding queues.
-            for callback_key, accounts_dict in self._callbacks.items():
-                if account in accounts_dict:
-                    accounts_dict[account].append(message)
+        # The dictionaries are replaced (never modified) when tracking begins or ends, so they can be read without lock
+        callbacks = self._callbacks
+        queues = self._queues
 
-                if is_send and link_as_account in accounts_dict:
-                    accounts_dict[link_as_account].append(message)
+        # Then, we add this message to the corresponding queues (once per callback).
+        # In case a subscription to all acounts is configured, every message is added.
+        for callback_key, accounts in callbacks.items():
+            if account in accounts or (is_send and link_as_account in accounts) or "all" in accounts:
+                messages_queue = queues.get(callback_key)
 
-                # In case a subscription to all acounts is configured:
-                if "all" in accounts_dict:
-                    accounts_dict["all"].append(message)
+                if messages_queue is not None:
+                    messages_queue.put(message)
 
     def start(self, timeout_seconds=10):
         if not self.running:
-            self._thread = Thread(target=self._thread_loop, daemon=True)
             self._finish = False
-            #self._subscribe()
-            self._thread.start()
+
+            with self._lock:
+                self._error = None
+
+            self._connection_success_event.clear()
+            self._future = asyncio.run_coroutine_threadsafe(self._handler(), _ensure_loop())
 
             # We seek for the connection to succeed before returning
             if not self._connection_success_event.wait(timeout_seconds):
+                self._future.cancel()
                 raise TimeoutError("Could not connect to the websocket server.")
 
             error = self._error
@@ -225,18 +343,19 @@ class NodeWebsocket:
     def stop(self):
         if self.running and not self._finish:
             self._finish = True
-            try:
-                self._thread.join()
-            except RuntimeError:
-                pass
 
-            with self._lock:
-                self._thread = None
+            # The pending actions are sent before the handler finishes
+            self._queue_action(None)
+            wait([self._future])
+
+        with self._lock:
+            self._actions_list.clear()
+
         self._callbacks = {}
+        self._queues = {}
 
-    def _start_confirmation_tracking(self, accounts_list, callback):
-        accounts_to_subscribe_list = [acc for acc in np.unique(np.hstack([self.accounts_tracked, accounts_list]))]
-        self._subscribe(accounts_to_subscribe_list)
+    def _start_confirmation_tracking(self, accounts_list, callback_key):
+        accounts_to_subscribe_list = sorted(set(self.accounts_tracked).union(accounts_list))
 
         """action_start_confirmation_tracking = {
             "action": "update",
@@ -247,19 +366,33 @@ class NodeWebsocket:
         }"""
 
         with self._lock:
-            callback_key = self._get_callback_key(callback)
-            self._callbacks.setdefault(callback_key, {})
-            self._callbacks[callback_key].update({a:[] for a in accounts_list})
+            accounts = set(self._callbacks.get(callback_key, ()))
+            accounts.update(accounts_list)
 
             if len(accounts_list) == 0:
-                self._callbacks[callback_key]['all'] = []
+                accounts.add('all')
+
+            # The websocket thread puts here the messages for this callback, and the tracking thread blocks on them
+            # until they arrive, so no message is lost between both
+            messages_queue = self._queues.get(callback_key) or queue.Queue()
+
+            # Copies are assigned instead of modifying the dictionaries, which are read without lock for every message.
+            # The queue is published first, so that a callback is never found without its queue.
+            self._queues = {**self._queues, callback_key: messages_queue}
+            self._callbacks = {**self._callbacks, callback_key: frozenset(accounts)}
+
+        # Subscribed once the queue is ready, so that no confirmation is missed
+        self._subscribe(accounts_to_subscribe_list)
 
         #if len(accounts_list) > 0:
         #    self._queue_action(action_start_confirmation_tracking)
 
-    def _end_confirmation_tracking(self, accounts_list, callback):
+        return messages_queue
+
+    def _end_confirmation_tracking(self, accounts_list, callback_key):
         if self.running:
-            accounts_to_subscribe_list = [acc for acc in self.accounts_tracked if acc not in accounts_list]
+            accounts_to_remove = set(accounts_list)
+            accounts_to_subscribe_list = [acc for acc in self.accounts_tracked if acc not in accounts_to_remove]
             self._unsubscribe(accounts_list)
             if len(accounts_to_subscribe_list) > 0:
                 self._subscribe(accounts_to_subscribe_list)
@@ -273,8 +406,9 @@ class NodeWebsocket:
             }"""
 
             with self._lock:
-                callback_key = self._get_callback_key(callback)
-                del self._callbacks[callback_key]
+                self._callbacks = {key: accounts for key, accounts in self._callbacks.items() if key != callback_key}
+                self._queues = {key: messages_queue for key, messages_queue in self._queues.items()
+                                if key != callback_key}
 
             #if len(accounts_list) > 0:
             #    self._queue_action(action_end_confirmation_tracking)
@@ -293,35 +427,33 @@ class NodeWebsocket:
                 * If empty list, it will notify every confirmation independently of the procedence.
                     Note that not all the nodes support this operation.
         """
-        if initial_accounts is None:
-            initial_accounts = []
+        if initial_accounts is None or len(initial_accounts) == 0:
+            self._queue_action(self._subscribe_payload)
+            return
 
         action = {
             "action": "subscribe",
             "topic": self._topic,
+            "options": {"accounts": initial_accounts}
         }
 
-        if len(initial_accounts) > 0:
-            action['options'] = {"accounts": initial_accounts}
-
-        self._queue_action(action)
+        self._queue_action(json_dumps(action).decode())
 
     def _unsubscribe(self, initial_accounts=None):
         """
         Removes the subscription from the websocket.
         """
-        if initial_accounts is None:
-            initial_accounts = []
+        if initial_accounts is None or len(initial_accounts) == 0:
+            self._queue_action(self._unsubscribe_payload)
+            return
 
         action = {
             "action": "unsubscribe",
             "topic": self._topic,
+            "options": {"accounts": initial_accounts}
         }
 
-        if len(initial_accounts) > 0:
-            action['options'] = {"accounts": initial_accounts}
-
-        self._queue_action(action)
+        self._queue_action(json_dumps(action).decode())
 
     def _get_callback_key(self, callback):
         return f"[{threading.get_ident()}] {str(callback)}"
@@ -1,3 +1,6 @@
+import asyncio
+import queue
+
 from nanoblocks.utils import TimedVariable
 
 
@@ -7,36 +10,66 @@ class Tracking:
         self._accounts_list = accounts_list
         self._callback = callback
 
+        # The key identifying the callback in the websocket is computed once, not on every operation
+        self._callback_key = ws._get_callback_key(callback)
+        self._messages_queue = None
+
     def begin(self):
         if len(self._accounts_list) == 0:
             self._ws._unsubscribe()
             self._ws._subscribe(initial_accounts=[])
 
-        self._ws._start_confirmation_tracking(self._accounts_list, self._callback)
+        self._messages_queue = self._ws._start_confirmation_tracking(self._accounts_list, self._callback_key)
 
     def join(self, timeout_seconds=None):
-        callback_result = True
+        """
+        Invokes the callback with every confirmation received, in arrival order, until the callback returns False or
+        the timeout expires.
+
+        :param timeout_seconds:
+            Maximum number of seconds to wait for confirmations. None to wait indefinitely.
+        """
+        messages_queue = self._messages_queue
+
+        if messages_queue is None:
+            raise RuntimeError("Tracking must begin before joining it.")
 
         start = TimedVariable(None)
-        while callback_result:
-            # We iterate constantly over the messages until no messages are found, or until False is returned in the
-            # callback.
+
+        while True:
             if not self._ws.running:
                 raise ConnectionResetError("Websocket disconnected.")
 
-            messages = self._ws._pop_messages(self._callback, self._accounts_list)
+            wait_seconds = None
 
-            for message in messages:
-                callback_result = self._callback(message)
+            if timeout_seconds is not None:
+                wait_seconds = timeout_seconds - start.last_update_elapsed_time
 
-                if not callback_result:
+                if wait_seconds <= 0:
                     break
 
-            # This locks the thread until unlocked by the websocket or until 3 seconds passed
-            self._ws._callback_event.wait(3)
+            # Blocks until a message arrives (or the timeout expires), without polling
+            try:
+                message = messages_queue.get(timeout=wait_seconds)
+
+            except queue.Empty:
+                continue
+
+            # The websocket puts a None message when it disconnects
+            if message is None:
+                raise ConnectionResetError("Websocket disconnected.")
+
+            if not self._callback(message):
+                break
+
+    async def ajoin(self, timeout_seconds=None):
+        """
+        Asynchronous version of `join()`, for callers running inside an event loop.
 
-            if timeout_seconds is not None and start.last_update_elapsed_time >= timeout_seconds:
-                callback_result = False
+        For the parameters, check `join()`.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.join, timeout_seconds)
 
     def end(self):
-        self._ws._end_confirmation_tracking(self._accounts_list, self._callback)
+        self._ws._end_confirmation_tracking(self._accounts_list, self._callback_key)
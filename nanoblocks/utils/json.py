@@ -0,0 +1,11 @@
+import json
+
+try:
+    # orjson (optional) encodes and decodes several times faster than the json module
+    from orjson import dumps as json_dumps, loads as json_loads
+
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
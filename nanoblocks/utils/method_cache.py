@@ -5,17 +5,34 @@ without executing again the method itself, until the time threshold is met.
 
 This is useful when dealing with expensive calls, like for example querying a node.
 """
+import sqlite3
+import time
+from collections import OrderedDict
+from os.path import expanduser
+from threading import RLock
+
 from nanoblocks import rcParams
 from nanoblocks.utils import TimedVariable
+from nanoblocks.utils.json import json_dumps, json_loads
+
+# Cached methods may be called from several threads at once (for example, the parallel requests of a snapshot), so
+# the cache dictionaries are only read and written while holding this lock. The cached methods run outside of it.
+_cache_lock = RLock()
+
+# Number of seconds declared by each cached function, so that the periodic clear keeps its outputs for that long.
+_function_seconds = {}
 
 
 def clear_expired_keys(cachemod_dict, counter_expiration_key="___expiration_counter___"):
     """
     Checks for expired keys and clears them from the cache.
-    The cache must contain TimedVariable values in order to be cleared.
+    The cache must contain, for each cached method, a dictionary of TimedVariable values in order to be cleared.
+
+    An output expires once it is older than the seconds declared by its method in `cache()`, or than the clear interval
+    if it is longer (outputs cached with a longer `_cache_time` are kept until then).
 
     :param cachemod_dict:
-        Cache dictionary to explore for expired keys. Its values must be of type TimedVariable.
+        Cache dictionary to explore for expired keys. Its values must be dictionaries of TimedVariable values.
 
     :param counter_expiration_key:
         Name of the key to store expiration date.
@@ -23,7 +40,7 @@ def clear_expired_keys(cachemod_dict, counter_expiration_key="___expiration_coun
         clear_expired_keys() execution. This allows the function to know when to clear again.
 
     :return:
-        Clean cache dictionary (without expired keys).
+        The same cache dictionary, cleaned in place from expired keys.
     """
 
     counter = cachemod_dict.get(counter_expiration_key)
@@ -34,22 +51,162 @@ def clear_expired_keys(cachemod_dict, counter_expiration_key="___expiration_coun
 
     cache_expiration_time = rcParams["global.cache.expiration_interval_seconds"]
 
-    if counter.last_update_elapsed_time >= cache_expiration_time:
-        counter.refresh()
+    # This runs on every cached call: the elapsed times are computed inline, with a single read of the clock.
+    current_time = time.monotonic()
+
+    # noinspection PyProtectedMember
+    if counter._monotonic_timestamp > current_time - cache_expiration_time:
+        return cachemod_dict
+
+    counter.refresh()
 
-        # Here we clear the cache dictionary from expired keys.
-        cachemod_dict = {k: v for k, v in cachemod_dict.items()
-                         if v.last_update_elapsed_time < cache_expiration_time and k != counter_expiration_key}
+    # Here we clear the cache dictionary from expired keys, in place.
+    for k, entries in list(cachemod_dict.items()):
+        if k == counter_expiration_key:
+            continue
+
+        expired_timestamp = current_time - max(_function_seconds.get(k, 0), cache_expiration_time)
+
+        # noinspection PyProtectedMember
+        expired = [parameters for parameters, v in entries.items() if v._monotonic_timestamp <= expired_timestamp]
+
+        for parameters in expired:
+            del entries[parameters]
+
+        if len(entries) == 0:
+            del cachemod_dict[k]
 
     return cachemod_dict
 
 
-def cache(seconds=1, cache_parameters=True):
+def clear_cache(instance):
+    """
+    Discards every output cached in memory for the methods of the given object, so that further calls execute them
+    again. The persistent cache is not affected.
+
+    :param instance:
+        Object with methods decorated with `cache()`.
+    """
+    with _cache_lock:
+        instance._cachemod_internal_cache = {}
+
+
+_persistent_connections = {}
+
+
+def _persistent_connection():
+    """
+    Retrieves the connection to the persistent cache database set in rcParams['global.cache.persist_path'].
+
+    :return:
+        sqlite3 connection, or None if the persistent cache is disabled. Must be used while holding the cache lock.
+    """
+    path = rcParams["global.cache.persist_path"]
+
+    if path is None:
+        return None
+
+    path = expanduser(path)
+    connection = _persistent_connections.get(path)
+
+    if connection is None:
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, expiration REAL, value BLOB)")
+        _persistent_connections[path] = connection
+
+    return connection
+
+
+def persistent_get(key):
+    """
+    Retrieves a value from the persistent cache.
+
+    :param key:
+        Key of the value.
+
+    :return:
+        Tuple (found, value). `found` is False if the key is not in the persistent cache, it is expired or the
+        persistent cache is disabled.
+    """
+    with _cache_lock:
+        connection = _persistent_connection()
+
+        if connection is None:
+            return False, None
+
+        row = connection.execute("SELECT expiration, value FROM cache WHERE key = ?", (key,)).fetchone()
+
+    if row is None or row[0] < time.time():
+        return False, None
+
+    return True, json_loads(row[1])
+
+
+def persistent_set(key, value, seconds):
+    """
+    Stores a value in the persistent cache (if enabled), so that it is reused by other processes.
+
+    :param key:
+        Key of the value.
+
+    :param value:
+        JSON serializable value to store.
+
+    :param seconds:
+        Number of seconds for the value to expire.
+    """
+    with _cache_lock:
+        connection = _persistent_connection()
+
+        if connection is None:
+            return
+
+        with connection:
+            connection.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                               (key, time.time() + seconds, json_dumps(value)))
+
+
+def parameters_key(args, kwargs):
+    """
+    Builds a compact key that identifies the given call parameters.
+
+    Hashable parameters (the usual case: strings, numbers, booleans) are used directly as a tuple key, which costs
+    almost nothing to build. Unhashable parameters (for example, lists of thousands of addresses) are serialized to
+    JSON bytes, which is much faster than formatting them with `str()`. Parameters that can't be serialized to JSON
+    fall back to `str()`.
+
+    :param args:
+        Tuple of positional parameters.
+
+    :param kwargs:
+        Dictionary of keyword parameters.
+
+    :return:
+        Tuple, bytes or string key.
+    """
+    key = (args, tuple(sorted(kwargs.items()))) if len(kwargs) > 0 else args
+
+    try:
+        hash(key)
+        return key
+
+    except TypeError:
+        pass
+
+    try:
+        return json_dumps((args, sorted(kwargs.items())))
+
+    except TypeError:
+        return str(args) + str(kwargs)
+
+
+def cache(seconds=1, cache_parameters=True, persist=False, maxsize=10000, persist_seconds=None):
     """
     Decorates a method of a class for caching its output.
 
     The cache is stored inside the object under the attribute '_cachemod_internal_cache'. This cache is a dictionary
-    containing TimedVariable objects wrapping the outputs of each of the cached functions.
+    containing, for each of the cached functions, an ordered dictionary of TimedVariable objects wrapping its outputs
+    (one per different parameters, up to `maxsize`).
     Periodically, a cache clear is triggered when the time threshold specified by the option
     rcParams['global.cache.expiration_interval_seconds'] is met.
 
@@ -59,7 +216,7 @@ def cache(seconds=1, cache_parameters=True):
 
     The cache time of a method can be dynamically modified by the caller by specifying the parameter `_cache_time=X` in
     the method call. This is a volatile parameter, meaning that it only affects once for the caller. The cache can be
-    bypassed by setting `_cache_time=0`.
+    bypassed by setting `_cache_time=0`, which also skips the persistent cache.
 
     :param seconds:
         Number of seconds to keep this entry in the cache after its first cache.
@@ -67,35 +224,135 @@ def cache(seconds=1, cache_parameters=True):
     :param cache_parameters:
         Specifies whether the cache key should take into consideration parameters or not.
 
+    :param maxsize:
+        Maximum number of outputs (one per different parameters) kept in the cache of an object for this method. When
+        exceeded, the least recently used output is discarded.
+
+    :param persist:
+        Specifies whether the output should also be stored in the persistent cache on disk, so that other processes
+        reuse it while it does not expire. Only applies when rcParams['global.cache.persist_path'] is set and the
+        object identifies its source with the property `_cache_namespace` (for example, the URL of a node).
+
+    :param persist_seconds:
+        Number of seconds to keep the output in the persistent cache. By default, the same as `seconds`.
+
     :return:
-        Decorated function.
+        Decorated function. Its attribute `peek(instance, *args, **kwargs)` returns a tuple (found, output) with the
+        last output known for the given parameters (from memory or from the persistent cache), without executing the
+        method.
     """
+    if persist_seconds is None:
+        persist_seconds = seconds
+
     def pseudo_decorator(func):
+        _function_seconds[func] = seconds
+
+        def persistent_key(instance, parameters):
+            # Key of the output in the persistent cache, or None if it is not persisted.
+            namespace = getattr(instance, "_cache_namespace", None) if persist else None
+
+            if namespace is None:
+                return None
+
+            if type(parameters) is bytes:
+                parameters = parameters.decode()
+
+            elif type(parameters) is tuple:
+                try:
+                    parameters = json_dumps(parameters).decode()
+
+                except TypeError:
+                    parameters = str(parameters)
+
+            return f"{namespace}|{func.__qualname__}|{parameters}"
+
+        def compute(instance, parameters, refresh, *args, **kwargs):
+            # Executes the method, unless the persistent cache holds a valid output for it and the caller does not
+            # force a refresh.
+            persist_key = persistent_key(instance, parameters)
+
+            if persist_key is None:
+                return func(instance, *args, **kwargs)
+
+            found, value = (False, None) if refresh else persistent_get(persist_key)
+
+            if not found:
+                value = func(instance, *args, **kwargs)
+
+                # Error answers are transient (rate limits, node not synced): they are never shared with other
+                # processes.
+                if not (type(value) is dict and 'error' in value):
+                    persistent_set(persist_key, value, persist_seconds)
+
+            return value
+
+        def peek(instance, *args, **kwargs):
+            parameters = parameters_key(args, kwargs) if cache_parameters else None
+
+            with _cache_lock:
+                entries = getattr(instance, "_cachemod_internal_cache", {}).get(func) or {}
+                result = entries.get(parameters)
+
+            if result is not None:
+                return True, result.value
+
+            persist_key = persistent_key(instance, parameters)
+
+            if persist_key is None:
+                return False, None
+
+            return persistent_get(persist_key)
 
         def real_wrapper(instance, *args, **kwargs):
+            # The cache time given by the caller only affects this call; it is not a parameter of the method.
+            cache_time = kwargs.pop("_cache_time", seconds)
+
             # 1. We create the cache dictionary inside the object if it doesn't exist.
 
-            cache_dict = clear_expired_keys(instance._cachemod_internal_cache if hasattr(instance, "_cachemod_internal_cache") else {})
-            instance._cachemod_internal_cache = cache_dict
+            # Then, build the caching key based on the parameters (if cache_parameters is True), inside the entries of
+            # the function.
+            parameters = parameters_key(args, kwargs) if cache_parameters else None
+
+            with _cache_lock:
+                cache_dict = getattr(instance, "_cachemod_internal_cache", None)
+
+                if cache_dict is None:
+                    cache_dict = {}
+                    instance._cachemod_internal_cache = cache_dict
 
-            # Then, build the caching key based on the function reference. It will include parameters if cache_parameters is True.
-            key = str(func) + ((str(args) + str(kwargs)) if cache_parameters else '')
+                clear_expired_keys(cache_dict)
 
-            result = cache_dict.get(key)
+                entries = cache_dict.get(func)
+
+                if entries is None:
+                    entries = OrderedDict()
+                    cache_dict[func] = entries
+
+                result = entries.get(parameters)
+
+                if result is not None:
+                    entries.move_to_end(parameters)
 
             if result is None:
                 # We store the output of the function wrapped in a TimedVariable inside the cache dictionary.
                 # The timed variable allows us to track last update and know if it is expired.
-                result = TimedVariable(func(instance, *args, **kwargs))
-                cache_dict[key] = result
+                result = TimedVariable(compute(instance, parameters, cache_time == 0, *args, **kwargs))
+
+                with _cache_lock:
+                    entries[parameters] = result
+
+                    if len(entries) > maxsize:
+                        entries.popitem(last=False)
 
-            elif result.last_update_elapsed_time >= kwargs.get("_cache_time", seconds):
+            # noinspection PyProtectedMember
+            elif time.monotonic() - result._monotonic_timestamp >= cache_time:
                 # In case the key exist but expired, we update its value with the output of the function.
                 # An update triggers a refresh of the internal `last_update` registry.
-                result.value = func(instance, *args, **kwargs)
+                result.value = compute(instance, parameters, cache_time == 0, *args, **kwargs)
 
             return result.value
 
+        real_wrapper.peek = peek
         return real_wrapper
 
     return pseudo_decorator
@@ -0,0 +1,103 @@
+import zlib
+
+import joblib
+
+from nanoblocks.utils.json import json_dumps, json_loads
+
+try:
+    # msgpack (optional) packs and unpacks nested dictionaries several times faster than pickle or JSON
+    import msgpack
+
+except ImportError:
+    msgpack = None
+
+try:
+    # zstandard (optional) compresses denser than zlib at a comparable speed
+    import zstandard
+
+except ImportError:
+    zstandard = None
+
+
+_MAGIC = b"NANOBLOCKS"
+_FORMAT_VERSION = 1
+
+_ENCODING_JSON = 0
+_ENCODING_MSGPACK = 1
+
+_COMPRESSION_ZLIB = 0
+_COMPRESSION_ZSTD = 1
+
+
+def dump(obj, file):
+    """
+    Serializes the given object (made of dicts, lists, strings and numbers) into a file.
+
+    The object is packed with msgpack and compressed with zstandard when those packages are installed. Otherwise, it
+    is encoded as JSON and compressed with zlib. Either way, the file can be loaded back with `load()`.
+
+    :param file:
+        Path of the file to write, or a file object opened in binary mode.
+    """
+    if msgpack is not None:
+        encoding, data = _ENCODING_MSGPACK, msgpack.packb(obj)
+    else:
+        encoding, data = _ENCODING_JSON, json_dumps(obj)
+
+    if zstandard is not None:
+        compression, data = _COMPRESSION_ZSTD, zstandard.ZstdCompressor(level=3).compress(data)
+    else:
+        compression, data = _COMPRESSION_ZLIB, zlib.compress(data, 1)
+
+    header = _MAGIC + bytes([_FORMAT_VERSION, encoding, compression])
+
+    if hasattr(file, "write"):
+        file.write(header + data)
+    else:
+        with open(file, "wb") as f:
+            f.write(header + data)
+
+
+def load(file):
+    """
+    Loads an object serialized with `dump()`.
+
+    Files written by previous versions of nanoblocks (with joblib) are also supported.
+
+    :param file:
+        Path of the file to read, or a file object opened in binary mode.
+    """
+    if hasattr(file, "read"):
+        raw = file.read()
+    else:
+        with open(file, "rb") as f:
+            raw = f.read()
+
+    if not raw.startswith(_MAGIC):
+        if hasattr(file, "seek"):
+            file.seek(0)
+
+        return joblib.load(file)
+
+    format_version, encoding, compression = raw[len(_MAGIC):len(_MAGIC) + 3]
+    data = raw[len(_MAGIC) + 3:]
+
+    if format_version > _FORMAT_VERSION:
+        raise ValueError(f"The file was written with a newer version of nanoblocks (format {format_version}).")
+
+    if compression == _COMPRESSION_ZSTD:
+        if zstandard is None:
+            raise ImportError("The file is compressed with zstandard. Install it with `pip install zstandard`.")
+
+        data = zstandard.ZstdDecompressor().decompress(data)
+
+    else:
+        data = zlib.decompress(data)
+
+    if encoding == _ENCODING_MSGPACK:
+        if msgpack is None:
+            raise ImportError("The file is packed with msgpack. Install it with `pip install msgpack`.")
+
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+    return json_loads(data)
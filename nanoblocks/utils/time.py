@@ -1,11 +1,33 @@
-import pandas as pd
+from datetime import datetime, timezone
+from functools import lru_cache
 
-from datetime import datetime
 from tzlocal import get_localzone
 
+try:
+    # zoneinfo (Python 3.9+) resolves the IANA timezones from the standard library
+    from zoneinfo import ZoneInfo
+
+except ImportError:
+    # Older interpreters resolve them with dateutil, which is installed along with pandas
+    from dateutil.tz import gettz
+
+    def ZoneInfo(key):
+        zone = gettz(key)
+
+        if zone is None:
+            raise KeyError(f"No time zone found with key {key}")
+
+        return zone
+
 
 SYSTEM_TIMEZONE = str(get_localzone())
 
 
+@lru_cache(maxsize=None)
+def _zone_info(tz):
+    return ZoneInfo(tz)
+
+
 def now(tz=SYSTEM_TIMEZONE):
-    return pd.to_datetime(datetime.utcnow()).tz_localize("UTC").tz_convert(tz)
+    # Timezones are resolved once; building the current datetime with the standard library is far cheaper than pandas.
+    return datetime.now(timezone.utc).astimezone(_zone_info(tz) if type(tz) is str else tz)
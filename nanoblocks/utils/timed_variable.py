@@ -1,7 +1,5 @@
 import time
 
-from nanoblocks.utils.time import now
-
 
 class TimedVariable:
     """
@@ -24,6 +22,8 @@ class TimedVariable:
     >>> print(variable.last_update_elapsed_time)
     1.0
     """
+    __slots__ = ('_monotonic_timestamp', '_value')
+
     def __init__(self, variable):
         self._monotonic_timestamp = None
         self._value = None
@@ -52,8 +52,9 @@ class TimedVariable:
         return str(self._value)
 
     def _repr_html_(self):
-        if hasattr(self._value, "_repr_html_"):
-            # noinspection PyProtectedMember
-            return self._value._repr_html_()
+        repr_html = getattr(self._value, "_repr_html_", None)
+
+        if repr_html is not None:
+            return repr_html()
         else:
             return repr(self)
@@ -30,6 +30,7 @@ class Wallet(NanoblocksClass):
             seed = make_seed()
 
         self._seed = seed
+        self._accounts = WalletAccounts(seed, nano_network=nano_network)
 
     @classmethod
     def from_mnemonic(cls, words_list, nano_network):
@@ -49,7 +50,7 @@ class Wallet(NanoblocksClass):
         if len(words_list) != 24:
             raise KeyError("The length of the list should be 24, no more, no less words")
 
-        if any([x is None for x in words_list]):
+        if any(x is None for x in words_list):
             words_list = fill_bip39_words(words_list)
 
         seed = derive_seed(words_list)
@@ -75,7 +76,7 @@ class Wallet(NanoblocksClass):
         """
         Retrieves access to the accounts from this wallet.
         """
-        return WalletAccounts(self._seed, nano_network=self.network)
+        return self._accounts
 
     def __repr__(self):
         return "Nano Wallet (Type wallet.accounts[integer_index] to access an account)."
@@ -1,7 +1,20 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
 from nanoblocks.base import NanoblocksClass
 from nanoblocks.utils.crypto import account_privkey, account_pubkey, account_address
 
 
+def _derive_account(seed, account_index):
+    """
+    Derives the private key, public key and address of the account at the given index of the seed.
+    """
+    account_private_key = account_privkey(seed, account_index)
+    account_public_key = account_pubkey(account_private_key)
+    return account_private_key, account_public_key, account_address(account_public_key)
+
+
 class WalletAccounts(NanoblocksClass):
     """
     Class to handle the automatic creation of accounts inside a wallet
@@ -21,6 +34,10 @@ class WalletAccounts(NanoblocksClass):
         super().__init__(nano_network)
         self._seed = seed
 
+        # Deriving the public key (an ed25519 scalar multiplication) takes milliseconds, hence the keys of the most
+        # recently accessed accounts are kept. The cache belongs to this object, so the keys are released with it.
+        self._derive_account = lru_cache(maxsize=4096)(partial(_derive_account, seed))
+
     def __repr__(self):
         return "Accounts from Nano Wallet (accounts can be accessed through indexes)"
 
@@ -34,17 +51,93 @@ class WalletAccounts(NanoblocksClass):
         :param account_index:
             index of the account. Could be any value between 1 and 2**32.
         """
-        account_private_key = account_privkey(self._seed, account_index)
-        account_public_key = account_pubkey(account_private_key)
-        account_public_address = account_address(account_public_key)
+        account_private_key, _, account_public_address = self._derive_account(account_index)
 
         account = self.accounts[account_public_address]
-        account.unlock(account_private_key)
+
+        # The account may be cached from a previous access, already unlocked with this same key
+        if not account.unlocked:
+            account.unlock(account_private_key)
 
         if account.last_update_elapsed_seconds > 15:
             account.update()
 
         return account
 
+    def batch(self, account_indexes):
+        """
+        Retrieves the accounts given at many positions within this wallet seed at once.
+
+        The balances and frontiers of all the accounts are requested to the node in a single bulk call, instead of one
+        call per account. Useful to scan a range of accounts of the wallet.
+
+        :param account_indexes:
+            iterable of indexes of the accounts. Each could be any value between 1 and 2**32.
+
+        :return:
+            List of accounts, in the same order as the indexes.
+        """
+        derivations = [self._derive_account(account_index) for account_index in account_indexes]
+
+        if len(derivations) == 0:
+            return []
+
+        accounts = self.accounts[[account_public_address for _, _, account_public_address in derivations]]
+        result = []
+
+        for account_private_key, _, account_public_address in derivations:
+            account = accounts[account_public_address]
+
+            if not account.unlocked:
+                account.unlock(account_private_key)
+
+            result.append(account)
+
+        return result
+
+    def prefetch(self, account_indexes, executor=None):
+        """
+        Retrieves the accounts given at many positions within this wallet seed and generates the work for their next
+        block in parallel.
+
+        For opened accounts, the work is generated for the send difficulty, which is also valid for receive and change
+        blocks. For accounts not opened yet, the work is generated for the open (receive) block.
+
+        Work servers keep the generated works in their cache, so building the next block of these accounts reuses them.
+
+        :param account_indexes:
+            iterable of indexes of the accounts. Each could be any value between 1 and 2**32.
+
+        :param executor:
+            Executor where the work is generated. By default, a thread pool with one worker per CPU core.
+
+        :return:
+            Dictionary of {nano_address: work}.
+        """
+        accounts = self.batch(account_indexes)
+
+        if len(accounts) == 0 or self.work_server is None:
+            return {}
+
+        owned_executor = executor is None
+
+        if owned_executor:
+            executor = ThreadPoolExecutor(max_workers=min(len(accounts), os.cpu_count() or 1))
+
+        try:
+            futures = {account.address: executor.submit(self._generate_next_work, account) for account in accounts}
+
+            return {nano_address: future.result() for nano_address, future in futures.items()}
+
+        finally:
+            if owned_executor:
+                executor.shutdown(wait=False)
+
+    def _generate_next_work(self, account):
+        if account.frontier.is_first:
+            return self.work_server.generate_work_receive(account)
+
+        return self.work_server.generate_work_send(account)
+
     def __setitem__(self, key, value):
         raise NotImplementedError("Manually setting an account is not supported by the Nano Network")
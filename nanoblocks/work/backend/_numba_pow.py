@@ -0,0 +1,123 @@
+import numpy as np
+from numba import njit, prange
+
+
+# BLAKE2b initialization vector
+_IV = np.array([
+    0x6a09e667f3bcc908, 0xbb67ae8584caa73b, 0x3c6ef372fe94f82b, 0xa54ff53a5f1d36f1,
+    0x510e527fade682d1, 0x9b05688c2b3e6c1f, 0x1f83d9abfb41bd6b, 0x5be0cd19137e2179,
+], dtype=np.uint64)
+
+# BLAKE2b message schedule (12 rounds)
+_SIGMA = np.array([
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
+    [14, 10, 4, 8, 9, 15, 13, 6, 1, 12, 0, 2, 11, 7, 5, 3],
+    [11, 8, 12, 0, 5, 2, 15, 13, 10, 14, 3, 6, 7, 1, 9, 4],
+    [7, 9, 3, 1, 13, 12, 11, 14, 2, 6, 5, 10, 4, 0, 15, 8],
+    [9, 0, 5, 7, 2, 4, 10, 15, 14, 1, 11, 12, 6, 8, 3, 13],
+    [2, 12, 6, 10, 0, 11, 8, 3, 4, 13, 7, 5, 15, 14, 1, 9],
+    [12, 5, 1, 15, 14, 13, 4, 10, 0, 7, 6, 3, 9, 2, 8, 11],
+    [13, 11, 7, 14, 12, 1, 3, 9, 5, 0, 15, 4, 8, 6, 2, 10],
+    [6, 15, 14, 9, 11, 3, 0, 8, 12, 2, 13, 7, 1, 4, 10, 5],
+    [10, 2, 8, 4, 7, 6, 1, 5, 15, 11, 9, 14, 3, 12, 13, 0],
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
+    [14, 10, 4, 8, 9, 15, 13, 6, 1, 12, 0, 2, 11, 7, 5, 3],
+], dtype=np.uint8)
+
+# Parameter block for an unkeyed 8-byte digest: fanout 1, depth 1, digest length 8
+_PARAMETERS = np.uint64(0x01010008)
+
+# Work (8 bytes) followed by the block hash (32 bytes)
+_MESSAGE_LENGTH = np.uint64(40)
+
+_LAST_BLOCK = np.uint64(0xffffffffffffffff)
+
+
+@njit(inline="always")
+def _rotr(x, n):
+    return (x >> np.uint64(n)) | (x << np.uint64(64 - n))
+
+
+@njit(inline="always")
+def _mix(v, a, b, c, d, x, y):
+    v[a] = v[a] + v[b] + x
+    v[d] = _rotr(v[d] ^ v[a], 32)
+    v[c] = v[c] + v[d]
+    v[b] = _rotr(v[b] ^ v[c], 24)
+    v[a] = v[a] + v[b] + y
+    v[d] = _rotr(v[d] ^ v[a], 16)
+    v[c] = v[c] + v[d]
+    v[b] = _rotr(v[b] ^ v[c], 63)
+
+
+@njit(cache=True)
+def _blake2b_64(nonce, hash_words):
+    """
+    Computes the 8-byte BLAKE2b digest of the work (given as the nonce) followed by the block hash.
+
+    The message fits in a single block, so a single compression is enough.
+
+    :param nonce:
+        Work value, as the little-endian integer of its 8 bytes.
+
+    :param hash_words:
+        Block hash as 4 little-endian 64-bit words.
+
+    :return:
+        Digest as a little-endian 64-bit integer.
+    """
+    m = np.zeros(16, dtype=np.uint64)
+    m[0] = nonce
+    m[1:5] = hash_words
+
+    v = np.empty(16, dtype=np.uint64)
+    v[:8] = _IV
+    v[8:] = _IV
+    v[0] ^= _PARAMETERS
+    v[12] ^= _MESSAGE_LENGTH
+    v[14] ^= _LAST_BLOCK
+
+    for r in range(12):
+        s = _SIGMA[r]
+        _mix(v, 0, 4, 8, 12, m[s[0]], m[s[1]])
+        _mix(v, 1, 5, 9, 13, m[s[2]], m[s[3]])
+        _mix(v, 2, 6, 10, 14, m[s[4]], m[s[5]])
+        _mix(v, 3, 7, 11, 15, m[s[6]], m[s[7]])
+        _mix(v, 0, 5, 10, 15, m[s[8]], m[s[9]])
+        _mix(v, 1, 6, 11, 12, m[s[10]], m[s[11]])
+        _mix(v, 2, 7, 8, 13, m[s[12]], m[s[13]])
+        _mix(v, 3, 4, 9, 14, m[s[14]], m[s[15]])
+
+    return _IV[0] ^ _PARAMETERS ^ v[0] ^ v[8]
+
+
+@njit(parallel=True, cache=True)
+def search(hash_words, difficulty, start, count):
+    """
+    Tries `count` consecutive nonces from `start` in parallel, looking for one that reaches the difficulty.
+
+    :param hash_words:
+        Block hash as 4 little-endian 64-bit words.
+
+    :param difficulty:
+        Difficulty as a 64-bit integer.
+
+    :param start:
+        First nonce to try.
+
+    :param count:
+        Number of nonces to try.
+
+    :return:
+        Tuple (found, nonce).
+    """
+    valid = np.zeros(count, dtype=np.bool_)
+
+    for i in prange(count):
+        valid[i] = _blake2b_64(start + np.uint64(i), hash_words) >= difficulty
+
+    for i in range(count):
+        if valid[i]:
+            return True, start + np.uint64(i)
+
+    return False, start
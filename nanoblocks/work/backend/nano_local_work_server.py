@@ -1,26 +1,60 @@
 import hashlib
 import random
+import struct
+from fractions import Fraction
 from nanoblocks.account.account import Account
+from nanoblocks.utils.method_cache import cache, clear_cache
 from nanoblocks.work.work_server import WorkServer
 import warnings
 
+try:
+    # numba (optional) compiles the nonce search into a native loop that runs on every CPU core
+    import numpy as np
+    from nanoblocks.work.backend._numba_pow import search as _numba_search
+
+except ImportError:
+    _numba_search = None
+
+# Work packed as a little-endian unsigned 64-bit integer
+_WORK_STRUCT = struct.Struct("<Q")
+
 
 class NanoLocalWorkServer(WorkServer):
     """
     Local work generation.
     No remote server required, but slower.
     """
+    # Whether the slow work warning was already shown by this server
+    _slow_work_warned = False
+
     def generate_work_send(self, account: Account, work_difficulty=0xfffffff800000000, multiplier=1.0):
-        warnings.warn("Generating work locally for send blocks might take a lot of time (in the order of minutes). Using a remote work server with a GPU is highly encouraged for this task.")
-        return self._work_generate(account.frontier.hash, hex(work_difficulty)[2:], multiplier)
+        self._warn_slow_work("Generating work locally for send blocks might take a lot of time (in the order of minutes). Using a remote work server with a GPU is highly encouraged for this task.")
+        return self._cached_work_generate(bytes.fromhex(account.frontier.hash), work_difficulty, multiplier)
 
     def generate_work_change(self, account: Account, work_difficulty=0xfffffff800000000, multiplier=1.0):
-        warnings.warn("Generating work locally for change of representative might take a lot of time (in the order of minutes). Using a remote work server with a GPU is highly encouraged for this task.")
-        return self._work_generate(account.frontier.hash, hex(work_difficulty)[2:], multiplier)
+        self._warn_slow_work("Generating work locally for change of representative might take a lot of time (in the order of minutes). Using a remote work server with a GPU is highly encouraged for this task.")
+        return self._cached_work_generate(bytes.fromhex(account.frontier.hash), work_difficulty, multiplier)
 
     def generate_work_receive(self, account: Account, work_difficulty=0xfffffe0000000000, multiplier=1.0):
         hash_value = account.frontier.hash if not account.frontier.is_first else account.public_key
-        return self._work_generate(hash_value, hex(work_difficulty)[2:], multiplier)
+        return self._cached_work_generate(bytes.fromhex(hash_value), work_difficulty, multiplier)
+
+    def _warn_slow_work(self, message):
+        # Scripts generating work in a loop would get the same warning on every call; once is enough.
+        if not self._slow_work_warned:
+            self._slow_work_warned = True
+            warnings.warn(message, stacklevel=3)
+
+    def clear_work_cache(self):
+        """
+        Discards the works generated so far, so that further requests generate them again.
+        """
+        clear_cache(self)
+
+    # Work for the same hash and difficulty is valid forever, so retries for an unchanged frontier reuse it.
+    @cache(seconds=3600, cache_parameters=True, maxsize=256)
+    def _cached_work_generate(self, _hash, difficulty, multiplier=None):
+        return self._work_generate(_hash, difficulty, multiplier)
 
     @staticmethod
     def _work_generate(_hash, difficulty, multiplier=None):
@@ -29,45 +63,67 @@ class NanoLocalWorkServer(WorkServer):
         Extracted from https://github.com/npy0/nanopy/blob/c65a752bd21168ef5e4be25fc4658381d4df4f22/nanopy/__init__.py#L251
         Adapted for nanoblocks.
 
-        :param hash:
-            64 hex-char hash
+        :param _hash:
+            32 bytes hash
         :param difficulty:
-            16 hex-char difficulty
+            difficulty as integer
         :param multiplier:
             positive number, overrides difficulty
         :return:
             16 hex-char work
         """
-        assert len(_hash) == 64
-        _hash = bytes.fromhex(_hash)
-        b2b_h = bytearray.fromhex("0" * 16)
+        assert len(_hash) == 32
 
         if multiplier is not None:
             difficulty = NanoLocalWorkServer._from_multiplier(difficulty, multiplier)
 
-        difficulty = bytes.fromhex(difficulty)
+        if _numba_search is not None:
+            return NanoLocalWorkServer._work_search_numba(_hash, difficulty)
 
-        work = None
+        # The work is a 64-bit counter started at a random point, incremented on every attempt
+        nonce = random.getrandbits(64)
 
-        while b2b_h < difficulty:
+        # The hashed message (work + hash) is built once; only the first 8 bytes are rewritten on every attempt
+        message = bytearray(8) + _hash
+        pack_work = _WORK_STRUCT.pack_into
+        blake2b = hashlib.blake2b
+        from_bytes = int.from_bytes
 
-            work = bytearray((random.getrandbits(8) for i in range(8)))
+        while True:
+            pack_work(message, 0, nonce)
 
-            for r in range(0, 256):
-                work[7] = (work[7] + r) % 256
-                b2b_h = bytearray(hashlib.blake2b(work + _hash, digest_size=8).digest())
-                b2b_h.reverse()
-                if b2b_h >= difficulty:
-                    break
+            if from_bytes(blake2b(message, digest_size=8).digest(), "little") >= difficulty:
+                # The work is the nonce bytes in big-endian order
+                return format(nonce, "016x")
 
-        if work is not None:
-            work.reverse()
-            result = work.hex()
+            nonce = (nonce + 1) & 0xFFFFFFFFFFFFFFFF
 
-        else:
-            result = None
+    @staticmethod
+    def _work_search_numba(_hash, difficulty, chunk_size=2**16):
+        """
+        Searches the work with the numba compiled loop, trying chunks of consecutive nonces in parallel.
+
+        :param _hash:
+            32 bytes hash
+        :param difficulty:
+            difficulty as integer
+        :param chunk_size:
+            number of nonces tried on each call to the compiled loop
+        :return:
+            16 hex-char work
+        """
+        hash_words = np.frombuffer(_hash, dtype="<u8").astype(np.uint64)
+        difficulty = np.uint64(difficulty)
+        start = np.uint64(random.getrandbits(64))
+
+        while True:
+            found, nonce = _numba_search(hash_words, difficulty, start, chunk_size)
+
+            if found:
+                # The work is the nonce bytes in big-endian order
+                return format(int(nonce), "016x")
 
-        return result
+            start = np.uint64((int(start) + chunk_size) % (1 << 64))
 
     @staticmethod
     def _from_multiplier(difficulty_base, multiplier):
@@ -77,17 +133,23 @@ class NanoLocalWorkServer(WorkServer):
         Adapted for nanoblocks.
 
         :param difficulty_base:
-            16 hex-char base difficulty
+            base difficulty as integer
 
         :param multiplier:
-            positive number
+            positive number, or tuple (numerator, denominator) of integers
 
         :return:
-            16 hex-char difficulty
+            difficulty as integer
         """
-        return format(
-            int((int(difficulty_base, 16) - (1 << 64)) / multiplier + (1 << 64)), "016x"
-        )
+        if type(multiplier) is tuple:
+            multiplier = Fraction(*multiplier)
+        else:
+            multiplier = Fraction(multiplier).limit_denominator(10**6)
+
+        # Integer arithmetic keeps the 64 bits of precision that a float division loses. The division rounds down the
+        # distance to 2**64, so the difficulty is never easier than requested.
+        distance = (1 << 64) - difficulty_base
+        return (1 << 64) - distance * multiplier.denominator // multiplier.numerator
 
     def __repr__(self):
         return f"Local Work server"
@@ -1,8 +1,22 @@
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from nanoblocks import rcParams
 from nanoblocks.account.account import Account
+from nanoblocks.exceptions.work_error import WorkError
+from nanoblocks.utils.json import json_dumps, json_loads
+from nanoblocks.utils.method_cache import cache, clear_cache
 from nanoblocks.work.work_server import WorkServer
 
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
 class NanoRemoteWorkServer(WorkServer):
     """
     https://github.com/nanocurrency/nano-work-server
@@ -10,15 +24,113 @@ class NanoRemoteWorkServer(WorkServer):
     def __init__(self, work_server_http_url):
         self._work_server_http_url = work_server_http_url
 
+        # A persistent session keeps the connection to the work server alive between requests, avoiding a TCP+TLS
+        # handshake per work. Generating work is idempotent, so failed connections are retried by the adapter.
+        retries = Retry(total=rcParams['requests.max_retries'], backoff_factor=rcParams['requests.backoff_seconds'],
+                        allowed_methods=None)
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=rcParams['requests.pool_size'], max_retries=retries)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        weakref.finalize(self, self._session.close)
+
     def generate_work_send(self, account: Account, work_difficulty=0xfffffff800000000, multiplier=1.0):
-        return self._work_generate(account.frontier.hash, hex(work_difficulty)[2:], str(multiplier))['work']
+        return self._work(account.frontier.hash, hex(work_difficulty)[2:], str(multiplier))
 
     def generate_work_change(self, account: Account, work_difficulty=0xfffffff800000000, multiplier=1.0):
-        return self._work_generate(account.frontier.hash, hex(work_difficulty)[2:], str(multiplier))['work']
+        return self._work(account.frontier.hash, hex(work_difficulty)[2:], str(multiplier))
 
     def generate_work_receive(self, account: Account, work_difficulty=0xfffffe0000000000, multiplier=1.0):
         hash_value = account.frontier.hash if not account.frontier.is_first else account.public_key
-        return self._work_generate(hash_value, hex(work_difficulty)[2:], str(multiplier))['work']
+        return self._work(hash_value, hex(work_difficulty)[2:], str(multiplier))
+
+    def generate_work_many(self, accounts, kind="send", max_workers=None):
+        """
+        Generates the work for many accounts concurrently, and returns the list of works in order.
+
+        The requests share the connection pool of the work server, so their round trips overlap.
+
+        :param accounts:
+            List of accounts to generate the work for.
+
+        :param kind:
+            Kind of block the work is for: "send", "change" or "receive".
+
+        :param max_workers:
+            Maximum number of requests in flight at the same time. By default, rcParams["requests.pool_size"].
+        """
+        generate_work = self._work_generator(kind)
+        accounts = list(accounts)
+
+        if len(accounts) <= 1:
+            return [generate_work(account) for account in accounts]
+
+        if max_workers is None:
+            max_workers = rcParams["requests.pool_size"]
+
+        with ThreadPoolExecutor(max_workers=min(len(accounts), max_workers)) as executor:
+            return list(executor.map(generate_work, accounts))
+
+    async def agenerate_work_many(self, accounts, kind="send", max_workers=None):
+        """
+        Asynchronous version of `generate_work_many()`, for callers running inside an event loop.
+
+        Each request runs in a worker thread, so the event loop keeps serving other tasks while the work is generated.
+
+        :param accounts:
+            List of accounts to generate the work for.
+
+        :param kind:
+            Kind of block the work is for: "send", "change" or "receive".
+
+        :param max_workers:
+            Maximum number of requests in flight at the same time. By default, rcParams["requests.pool_size"].
+        """
+        generate_work = self._work_generator(kind)
+
+        if max_workers is None:
+            max_workers = rcParams["requests.pool_size"]
+
+        semaphore = asyncio.Semaphore(max_workers)
+        loop = asyncio.get_running_loop()
+
+        async def generate(account):
+            async with semaphore:
+                return await loop.run_in_executor(None, generate_work, account)
+
+        return list(await asyncio.gather(*(generate(account) for account in accounts)))
+
+    def _work_generator(self, kind):
+        generators = {
+            "send": self.generate_work_send,
+            "change": self.generate_work_change,
+            "receive": self.generate_work_receive,
+        }
+
+        try:
+            return generators[kind]
+
+        except KeyError:
+            raise ValueError(f"Unknown kind of block '{kind}'. Expected one of {list(generators)}.") from None
+
+    def clear_work_cache(self):
+        """
+        Discards the works generated so far, so that further requests ask the work server again.
+        """
+        clear_cache(self)
+
+    # Work for the same hash and difficulty is valid forever, so retries for an unchanged frontier reuse it. Failed
+    # requests raise, so they are not cached.
+    @cache(seconds=3600, cache_parameters=True, maxsize=256)
+    def _work(self, hash_value, difficulty, multiplier=None):
+        response = self._work_generate(hash_value, difficulty, multiplier)
+
+        if 'work' not in response:
+            raise WorkError(f"The work server could not generate the work: {response.get('error', response)}")
+
+        return response['work']
 
     def _work_generate(self, hash_value, difficulty, multiplier=None):
         message = {
@@ -28,8 +140,8 @@ class NanoRemoteWorkServer(WorkServer):
             "multiplier": multiplier
         }
 
-        response = requests.post(self._work_server_http_url, json=message)
-        return response.json()
+        response = self._session.post(self._work_server_http_url, data=json_dumps(message), headers=_JSON_HEADERS)
+        return json_loads(response.content)
 
     def __repr__(self):
         return f"Remote Work server [{self._work_server_http_url}]"
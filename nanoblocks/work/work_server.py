@@ -15,3 +15,6 @@ class WorkServer:
 
     def generate_work_receive(self, account: Account, work_difficulty=None, multiplier=1.0):
         pass
+
+    def clear_work_cache(self):
+        pass
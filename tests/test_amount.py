@@ -0,0 +1,114 @@
+import unittest
+
+from nanoblocks.currency import Amount
+from nanoblocks.currency.amount import REPRESENTATIONS
+
+
+class TestAmount(unittest.TestCase):
+
+    def test_constructors_all_units(self):
+        """
+        Strings, floats and integers are converted to the same raw value on every unit
+        """
+        for unit, unit_value in REPRESENTATIONS.items():
+            decimals_allowed = unit_value > 1
+
+            self.assertEqual(str(Amount("1.33", unit=unit)), str(133 * unit_value // 100 if decimals_allowed else 1))
+            self.assertEqual(str(Amount(1.5, unit=unit)), str(15 * unit_value // 10 if decimals_allowed else 1))
+            self.assertEqual(str(Amount(7, unit=unit)), str(7 * unit_value))
+            self.assertEqual(Amount("1.33", unit=unit).unit, unit)
+
+    def test_constructor_default_unit(self):
+        """
+        Amounts without unit are taken as NANO, unless the string contains the unit
+        """
+        self.assertEqual(Amount(1).unit, "NANO")
+        self.assertEqual(Amount("1.33").unit, "NANO")
+        self.assertEqual(Amount("1.33 nyano").unit, "nyano")
+        self.assertEqual(Amount("1.33nyano").format(), "1.33 nyano")
+        self.assertEqual(str(Amount("5 raw")), "5")
+        self.assertEqual(Amount("4150000 nyano"), Amount("4.15 NANO"))
+
+    def test_format(self):
+        """
+        Amounts are formatted with their unit, with or without squeezing the zeros
+        """
+        self.assertEqual(Amount("1.33").format(), "1.33 NANO")
+        self.assertEqual(Amount("1.33").format(show_unit=False), "1.33")
+        self.assertEqual(Amount("2").format(), "2.0 NANO")
+        self.assertEqual(Amount("0").format(), "0.0 NANO")
+        self.assertEqual(Amount("1.33").format(squeeze_zeros=False),
+                         "000000001.330000000000000000000000000000 NANO")
+        self.assertEqual(Amount("1.33", unit="GNano").format(squeeze_zeros=False),
+                         "000001.330000000000000000000000000000000 GNano")
+        self.assertEqual(Amount("1", unit="raw").format(squeeze_zeros=False),
+                         "000000000000000000000000000000000000001 raw")
+
+    def test_as_unit(self):
+        """
+        Changing the unit keeps the value
+        """
+        amount = Amount("1.5")
+
+        self.assertEqual(amount.as_unit("nyano").format(), "1500000.0 nyano")
+        self.assertEqual(amount.as_unit("raw").format(), "1500000000000000000000000000000 raw")
+        self.assertEqual(amount.as_unit("nyano"), amount)
+
+    def test_arithmetic(self):
+        """
+        Arithmetic operations keep the unit of the left operand
+        """
+        amount = Amount("2")
+
+        self.assertEqual((amount + 1).format(), "3.0 NANO")
+        self.assertEqual((amount - "0.5").format(), "1.5 NANO")
+        self.assertEqual((amount * 3).format(), "6.0 NANO")
+        self.assertEqual((amount // 4).format(), "0.5 NANO")
+        self.assertEqual((amount / 4).format(), "0.5 NANO")
+        self.assertEqual((amount.as_unit("nyano") + Amount("1 nyano")).format(), "2000001.0 nyano")
+        self.assertTrue(Amount("1") < Amount("1.5") <= "1.5")
+        self.assertTrue(Amount("1.5") < 2)
+
+    def test_negative_amounts(self):
+        """
+        Negative amounts are rejected, either given or as the result of an operation
+        """
+        with self.assertRaises(ValueError):
+            Amount("-1")
+
+        with self.assertRaises(ValueError):
+            Amount(-1)
+
+        with self.assertRaises(ValueError):
+            Amount("1") - Amount("2")
+
+        with self.assertRaises(ValueError):
+            Amount("1", unit="foo")
+
+    def test_shared_amounts(self):
+        """
+        Shared amounts are only reused for the same input
+        """
+        self.assertIs(Amount.of("1000", unit="raw"), Amount.of("1000", unit="raw"))
+        self.assertEqual(Amount.of(1.0).format(), "1.0 NANO")
+
+        Amount.of(1)
+
+        with self.assertRaises(TypeError):
+            Amount.of(True)
+
+        with self.assertRaises(TypeError):
+            Amount(True)
+
+    def test_to_hex(self):
+        """
+        Raw values are converted to an upper case hexadecimal padded to the given bytes
+        """
+        self.assertEqual(Amount("1.5").to_hex(16), "00000012EEC2EB3869AF64DF60000000")
+        self.assertEqual(Amount("255", unit="raw").to_hex(), "FF")
+        self.assertEqual(Amount(0).to_hex(16), "0" * 32)
+        self.assertEqual(Amount(0).to_hex(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+
+from nanoblocks.block.block import timestamps_bulk
+from nanoblocks.network import NanoNetwork
+from nanoblocks.node import NodeVirtual
+
+_ACCOUNT = "nano_3i1aq1cchnmbn9x5rsbap8b15akfh7wj7pwskuzi7ahz8oq6cobd99d4r3b7"
+_HASH = "991CF190094C00F0B68E2E5F75F6BEE95A2E0BD93CEAA4A6734DB9F19B728948"
+
+
+class TestBlocks(unittest.TestCase):
+
+    def setUp(self):
+        self.block_info = {
+            "block_account": _ACCOUNT,
+            "amount": "1000",
+            "balance": "1000",
+            "height": "1",
+            "local_timestamp": "1600000000",
+            "subtype": "receive",
+            "contents": {
+                "type": "state",
+                "account": _ACCOUNT,
+                "previous": "0" * 64,
+                "representative": _ACCOUNT,
+                "balance": "1000",
+                "link": "0" * 64,
+                "link_as_account": _ACCOUNT,
+                "signature": "0" * 128,
+                "work": "0" * 16
+            }
+        }
+
+        self.nano_network = NanoNetwork(node_backend=NodeVirtual(internal_blocks={_HASH: self.block_info}))
+
+    def test_node_answer_untouched(self):
+        """
+        Building blocks does not modify the answer of the node, which may be cached or shared
+        """
+        keys = set(self.block_info)
+        self.nano_network.blocks.get_many([_HASH])
+
+        self.assertEqual(set(self.block_info), keys)
+
+    def test_blocks_do_not_share_definition(self):
+        """
+        Blocks built from the same node answer keep their own state
+        """
+        first_block, = self.nano_network.blocks.get_many([_HASH])
+        second_block, = self.nano_network.blocks.get_many([_HASH])
+
+        # noinspection PyProtectedMember
+        first_block._block_definition['confirmed'] = True
+
+        # noinspection PyProtectedMember
+        self.assertFalse(second_block._block_definition['confirmed'])
+
+    def test_aget_many(self):
+        """
+        Blocks retrieved asynchronously match the synchronous ones
+        """
+        block, = asyncio.run(self.nano_network.blocks.aget_many([_HASH]))
+
+        self.assertEqual(block.hash, _HASH)
+        self.assertEqual(block.amount, self.nano_network.blocks.get_many([_HASH])[0].amount)
+
+    def test_unsigned_blocks_not_equal(self):
+        """
+        Distinct blocks without hash yet are not taken as the same block
+        """
+        account = self.nano_network.accounts.lazy_fetch(_ACCOUNT)
+        build = self.nano_network.blocks.factory.build
+
+        first_block = build(account, dict(self.block_info['contents'], link="1" * 64))
+        second_block = build(account, dict(self.block_info['contents'], link="2" * 64))
+
+        self.assertEqual(first_block.hash, 'Unknown')
+        self.assertNotEqual(first_block, second_block)
+        self.assertEqual(first_block, first_block)
+        self.assertEqual(len({first_block, second_block}), 2)
+
+        block, = self.nano_network.blocks.get_many([_HASH])
+        self.assertEqual(block, self.nano_network.blocks.get_many([_HASH])[0])
+
+    def test_bulk_timestamps_timezone(self):
+        """
+        Timestamps converted in bulk to another timezone are not taken as the local timestamps of the node
+        """
+        block, = self.nano_network.blocks.get_many([_HASH])
+        local_timestamp = block.local_timestamp
+
+        bulk_timestamp, = timestamps_bulk([block], "Asia/Tokyo")
+
+        self.assertEqual(bulk_timestamp, local_timestamp)
+        self.assertEqual(str(bulk_timestamp.tz), "Asia/Tokyo")
+        self.assertEqual(str(block.local_timestamp.tz), str(local_timestamp.tz))
+
+        timestamps_bulk([block], self.nano_network.node_backend.timezone)
+        self.assertEqual(block.local_timestamp, local_timestamp)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from nanoblocks import rcParams
+from nanoblocks.utils.method_cache import cache
+
+
+class _Node:
+
+    def __init__(self):
+        self.calls = 0
+
+    @cache(seconds=3600, cache_parameters=False)
+    def version(self):
+        self.calls += 1
+        return {"node_vendor": "Nano V1"}
+
+    @cache(seconds=1, cache_parameters=False)
+    def block_count(self):
+        self.calls += 1
+        return {"count": "1"}
+
+
+class _PersistedNode:
+    _cache_namespace = "http://node"
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = 0
+
+    @cache(seconds=600, cache_parameters=False, persist=True)
+    def available_supply(self):
+        self.calls += 1
+        return self.answer
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = 1000.0
+        patcher = mock.patch("time.monotonic", lambda: self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_long_ttl_survives_clear(self):
+        """
+        Outputs cached for longer than the clear interval are not discarded by the periodic clear
+        """
+        node = _Node()
+        node.version()
+
+        for _ in range(3):
+            self.clock += rcParams["global.cache.expiration_interval_seconds"] + 5
+            node.version()
+
+        self.assertEqual(node.calls, 1)
+
+        self.clock += 3600
+        node.version()
+
+        self.assertEqual(node.calls, 2)
+
+    def test_short_ttl_expires(self):
+        """
+        Outputs are refreshed once their declared time expires
+        """
+        node = _Node()
+        node.block_count()
+        node.block_count()
+
+        self.assertEqual(node.calls, 1)
+
+        self.clock += 2
+        node.block_count()
+
+        self.assertEqual(node.calls, 2)
+
+    def _persist(self):
+        persist_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(persist_dir.cleanup)
+
+        previous_path = rcParams["global.cache.persist_path"]
+        rcParams["global.cache.persist_path"] = os.path.join(persist_dir.name, "cache.sqlite")
+        self.addCleanup(rcParams.__setitem__, "global.cache.persist_path", previous_path)
+
+    def test_refresh_skips_persistent_cache(self):
+        """
+        Forcing a refresh with _cache_time=0 queries the node even if the persistent cache holds an output
+        """
+        self._persist()
+        _PersistedNode({"available": "1"}).available_supply()
+
+        node = _PersistedNode({"available": "2"})
+
+        self.assertEqual(node.available_supply(), {"available": "1"})
+        self.assertEqual(node.available_supply(_cache_time=0), {"available": "2"})
+        self.assertEqual(node.calls, 1)
+        self.assertEqual(_PersistedNode(None).available_supply(), {"available": "2"})
+
+    def test_errors_not_persisted(self):
+        """
+        Error answers are not shared through the persistent cache
+        """
+        self._persist()
+        _PersistedNode({"error": "boom"}).available_supply()
+
+        node = _PersistedNode({"available": "1"})
+
+        self.assertEqual(node.available_supply(), {"available": "1"})
+        self.assertEqual(node.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
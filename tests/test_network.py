@@ -0,0 +1,41 @@
+import unittest
+
+from nanoblocks.network import NanoNetwork
+from nanoblocks.node import NodeVirtual
+
+
+class TestNetwork(unittest.TestCase):
+
+    def test_representatives_online(self):
+        """
+        Online representatives can be iterated and carry the weight reported by the node
+        """
+        nano_network = NanoNetwork(node_backend=NodeVirtual())
+        representatives = nano_network.representatives_online
+        weights = nano_network.node_backend.representatives_online()['representatives']
+
+        self.assertEqual(len(representatives), len(weights))
+
+        for address, account in representatives.items():
+            self.assertEqual(account.address, address)
+            self.assertEqual(account.weight, int(weights[address]['weight']))
+
+        # Accounts are created once and reused
+        for address in representatives:
+            self.assertIs(representatives[address], representatives[address])
+
+    def test_representatives_bulk_update(self):
+        """
+        Representatives can be updated at once, keeping the weight reported by the node
+        """
+        nano_network = NanoNetwork(node_backend=NodeVirtual())
+        representatives = nano_network.representatives_online.update()
+        weights = representatives.weights
+
+        for address, account in representatives.items():
+            self.assertTrue(nano_network.accounts.is_cached(address))
+            self.assertEqual(account.weight, int(weights[address]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+from nanoblocks.work import NanoLocalWorkServer
+
+
+class TestWork(unittest.TestCase):
+
+    def test_difficulty_from_multiplier(self):
+        """
+        Difficulties from a multiplier match the float formula wherever it is exact
+        """
+        for difficulty_base in [0xfffffff800000000, 0xfffffe0000000000]:
+            for multiplier in [0.125, 0.5, 1, 2, 8, 64]:
+                expected = int((difficulty_base - (1 << 64)) / multiplier + (1 << 64))
+
+                self.assertEqual(NanoLocalWorkServer._from_multiplier(difficulty_base, multiplier), expected)
+
+    def test_difficulty_from_fraction_multiplier(self):
+        """
+        Multipliers can be given as a fraction, keeping the 64 bits of precision
+        """
+        difficulty = NanoLocalWorkServer._from_multiplier(0xfffffff800000000, (1, 3))
+        self.assertEqual(difficulty, 0xffffffe800000000)
+
+        # 1/3 can't be represented as a float, but it is limited to the same fraction
+        self.assertEqual(NanoLocalWorkServer._from_multiplier(0xfffffff800000000, 1 / 3), difficulty)
+
+        # Never easier than the exact value
+        difficulty = NanoLocalWorkServer._from_multiplier(0xfffffff800000001, 3)
+        self.assertGreaterEqual(difficulty * 3, (1 << 64) * 3 - ((1 << 64) - 0xfffffff800000001))
+
+
+if __name__ == '__main__':
+    unittest.main()